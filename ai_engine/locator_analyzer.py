@@ -3,17 +3,112 @@ AI Locator Analyzer Module
 Analyzes web pages and suggests optimal locators for elements
 """
 
+import asyncio
+import hashlib
 import json
+import os
 import re
+import string
 from typing import List, Dict, Any, Optional, Tuple
-from dataclasses import dataclass
-from bs4 import BeautifulSoup
+from dataclasses import dataclass, asdict
+from bs4 import BeautifulSoup, SoupStrainer
+from lxml import html as lxml_html
 import openai
+import orjson
 from dotenv import load_dotenv
 
 load_dotenv()
 
-@dataclass
+# Model and output budget are env-overridable; max_tokens is a hard
+# reservation on the provider side, so keep it near the real output size
+DEFAULT_MODEL = os.getenv("TESTMATE_MODEL", "gpt-4o-mini")
+MAX_TOKENS_LOCATOR = int(os.getenv("TESTMATE_MAX_TOKENS_LOCATOR", "600"))
+
+# Only these tags are ever queried during locator analysis, so tree
+# construction can be restricted to them
+_INTERACTIVE_TAGS_STRAINER = SoupStrainer(['button', 'input', 'a'])
+
+_VALID_LOCATOR_TYPES = frozenset({'id', 'name', 'class', 'css', 'xpath'})
+
+# Static instructions are kept byte-identical at the start of every
+# request (as the system message) so OpenAI's prompt-prefix cache hits
+LOCATOR_SYSTEM_PROMPT = """You are an expert in web element locators.
+Analyze the HTML element the user provides and suggest the best locators for it.
+
+Suggest locators in order of preference (most reliable first):
+1. ID (if available and unique)
+2. Name attribute (if available)
+3. CSS Selector (specific and reliable)
+4. XPath (if other options are not suitable)
+5. Class name (if unique and meaningful)
+
+For each suggestion, provide:
+- Locator type (id, name, css, xpath, class)
+- Locator value
+- Confidence score (0.0 to 1.0)
+- Reason for the suggestion
+- Alternative locators
+
+Return the suggestions in JSON format:
+{
+    "suggestions": [
+        {
+            "element_type": "id|name|css|xpath|class",
+            "locator_value": "actual locator value",
+            "confidence": 0.95,
+            "reason": "Why this locator is recommended",
+            "alternative_locators": [
+                {"type": "css", "value": "alternative locator"}
+            ]
+        }
+    ]
+}"""
+
+# Precompiled prompt templates: the constant text is allocated once at
+# import instead of being rebuilt from f-string parts on every call
+_BATCH_PROMPT_TMPL = string.Template("""
+Analyze the following HTML elements and suggest the best locators for each one:
+
+Elements (JSON array):
+$elements
+
+For each element, suggest locators in order of preference (most reliable first):
+1. ID (if available and unique)
+2. Name attribute (if available)
+3. CSS Selector (specific and reliable)
+4. XPath (if other options are not suitable)
+5. Class name (if unique and meaningful)
+
+For each suggestion, provide:
+- Locator type (id, name, css, xpath, class)
+- Locator value
+- Confidence score (0.0 to 1.0)
+- Reason for the suggestion
+- Alternative locators
+
+Return one entry per element, keyed by its description:
+{
+    "results": {
+        "element description": {
+            "suggestions": [
+                {
+                    "element_type": "id|name|css|xpath|class",
+                    "locator_value": "actual locator value",
+                    "confidence": 0.95,
+                    "reason": "Why this locator is recommended",
+                    "alternative_locators": [
+                        {"type": "css", "value": "alternative locator"}
+                    ]
+                }
+            ]
+        }
+    }
+}
+""")
+
+_ELEMENT_USER_TMPL = string.Template("Element Description: $desc\nHTML: $html")
+
+@dataclass(slots=True, frozen=True)
 class LocatorSuggestion:
     """Locator suggestion data structure"""
     element_type: str  # 'id', 'xpath', 'css', 'name', 'class'
@@ -28,52 +123,112 @@ class LocatorAnalyzer:
     def __init__(self, api_key: Optional[str] = None):
         """Initialize the locator analyzer with OpenAI API key"""
         self.api_key = api_key or openai.api_key
-        if self.api_key:
-            openai.api_key = self.api_key
+        # One client per instance reuses its httpx connection pool across
+        # calls instead of paying TCP+TLS setup per request
+        self._client = openai.OpenAI(api_key=self.api_key) if self.api_key else None
+        self._async_client = openai.AsyncOpenAI(api_key=self.api_key) if self.api_key else None
+        # API responses keyed by (element_desc, element HTML hash) so
+        # repeated runs on similar pages skip the API call entirely
+        self._response_cache: Dict[Tuple[str, str], Tuple[LocatorSuggestion, ...]] = {}
+        # Parsed soups keyed by (HTML hash, strained) so an
+        # analyze -> validate sequence on the same page parses once
+        self._soup_cache: Dict[Tuple[str, bool], BeautifulSoup] = {}
+        # lxml trees for XPath validation, keyed by HTML hash
+        self._tree_cache: Dict[str, Any] = {}
     
     def analyze_page_locators(self, html_content: str, target_elements: List[str] = None) -> Dict[str, List[LocatorSuggestion]]:
         """Analyze HTML content and suggest optimal locators for elements"""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = self._get_soup(html_content, strained=True)
         
         # If no specific elements are targeted, analyze common interactive elements
         if not target_elements:
             target_elements = self._find_interactive_elements(soup)
-        
+
+        # One batched API call for all elements amortizes the shared
+        # instructions and saves N-1 network round trips
+        if self.api_key and len(target_elements) > 1:
+            suggestions = self._suggest_locators_batch(soup, target_elements)
+            if suggestions is not None:
+                return suggestions
+
         suggestions = {}
-        
+
         for element_desc in target_elements:
             suggestions[element_desc] = self._suggest_locators_for_element(soup, element_desc)
-        
+
         return suggestions
     
     def _find_interactive_elements(self, soup: BeautifulSoup) -> List[str]:
-        """Find common interactive elements in the page"""
-        elements = []
-        
-        # Find buttons
-        buttons = soup.find_all(['button', 'input'], type=['button', 'submit'])
-        for btn in buttons[:5]:  # Limit to first 5 buttons
-            text = btn.get_text(strip=True) or btn.get('value', '') or btn.get('placeholder', '')
-            if text:
-                elements.append(f"Button: {text}")
-        
-        # Find links
-        links = soup.find_all('a', href=True)
-        for link in links[:5]:  # Limit to first 5 links
-            text = link.get_text(strip=True)
-            if text:
-                elements.append(f"Link: {text}")
-        
-        # Find form inputs
-        inputs = soup.find_all('input', type=['text', 'email', 'password'])
-        for inp in inputs[:5]:  # Limit to first 5 inputs
-            placeholder = inp.get('placeholder', '')
-            name = inp.get('name', '')
-            if placeholder or name:
-                elements.append(f"Input: {placeholder or name}")
-        
-        return elements
+        """Find common interactive elements in the page (single DOM pass)"""
+        buttons = []
+        links = []
+        inputs = []
+
+        # One traversal with per-category quotas instead of three find_all walks
+        for el in soup.descendants:
+            name = el.name
+            if name is None:
+                continue
+
+            if name == 'button' or (name == 'input' and el.get('type') in ('button', 'submit')):
+                if len(buttons) < 5:  # Limit to first 5 buttons
+                    text = el.get_text(strip=True) or el.get('value', '') or el.get('placeholder', '')
+                    if text:
+                        buttons.append(f"Button: {text}")
+            elif name == 'a' and el.get('href'):
+                if len(links) < 5:  # Limit to first 5 links
+                    text = el.get_text(strip=True)
+                    if text:
+                        links.append(f"Link: {text}")
+            elif name == 'input' and el.get('type') in ('text', 'email', 'password'):
+                if len(inputs) < 5:  # Limit to first 5 inputs
+                    text = el.get('placeholder', '') or el.get('name', '')
+                    if text:
+                        inputs.append(f"Input: {text}")
+
+            if len(buttons) >= 5 and len(links) >= 5 and len(inputs) >= 5:
+                break
+
+        return buttons + links + inputs
     
+    def _suggest_locators_batch(self, soup: BeautifulSoup, element_descs: List[str]) -> Optional[Dict[str, List[LocatorSuggestion]]]:
+        """Suggest locators for all elements in a single API call
+
+        Returns None if the batched response cannot be parsed, so the
+        caller can fall back to the per-element path.
+        """
+        try:
+            elements = []
+            for desc in element_descs:
+                element = self._find_element_by_description(soup, desc)
+                if element is not None:
+                    elements.append({"desc": desc, "html": self._compact_element_html(element)})
+
+            if not elements:
+                return {desc: [] for desc in element_descs}
+
+            prompt = _BATCH_PROMPT_TMPL.substitute(elements=json.dumps(elements, ensure_ascii=False))
+
+            response = self._client.chat.completions.create(
+                model=DEFAULT_MODEL,
+                messages=[{"role": "user", "content": prompt}],
+                max_tokens=MAX_TOKENS_LOCATOR * len(elements),
+                response_format={"type": "json_object"}
+            )
+
+            result = json.loads(response.choices[0].message.content)
+            results = result["results"]
+
+            suggestions = {}
+            for desc in element_descs:
+                entry = results.get(desc, {})
+                suggestions[desc] = [LocatorSuggestion(**s) for s in entry.get("suggestions", [])]
+            return suggestions
+
+        except Exception as e:
+            print(f"Error analyzing locators in batch: {e}")
+            return None
+
     def _suggest_locators_for_element(self, soup: BeautifulSoup, element_desc: str) -> List[LocatorSuggestion]:
         """Suggest locators for a specific element"""
         try:
@@ -84,76 +239,174 @@ class LocatorAnalyzer:
             element = self._find_element_by_description(soup, element_desc)
             if not element:
                 return []
-            
-            element_html = str(element)
-            
-            prompt = f"""
-            Analyze the following HTML element and suggest the best locators for it:
-            
-            Element Description: {element_desc}
-            HTML: {element_html}
-            
-            Please suggest locators in order of preference (most reliable first):
-            1. ID (if available and unique)
-            2. Name attribute (if available)
-            3. CSS Selector (specific and reliable)
-            4. XPath (if other options are not suitable)
-            5. Class name (if unique and meaningful)
-            
-            For each suggestion, provide:
-            - Locator type (id, name, css, xpath, class)
-            - Locator value
-            - Confidence score (0.0 to 1.0)
-            - Reason for the suggestion
-            - Alternative locators
-            
-            Return the suggestions in JSON format:
-            {{
-                "suggestions": [
-                    {{
-                        "element_type": "id|name|css|xpath|class",
-                        "locator_value": "actual locator value",
-                        "confidence": 0.95,
-                        "reason": "Why this locator is recommended",
-                        "alternative_locators": [
-                            {{"type": "css", "value": "alternative locator"}}
-                        ]
-                    }}
-                ]
-            }}
-            """
-            
-            response = openai.ChatCompletion.create(
-                model="gpt-3.5-turbo",
-                messages=[{"role": "user", "content": prompt}],
-                max_tokens=1000
+
+            element_html = self._compact_element_html(element)
+            cache_key = self._response_cache_key(element_desc, element_html)
+            cached = self._response_cache.get(cache_key)
+            if cached is not None:
+                return list(cached)
+
+            response = self._client.chat.completions.create(
+                model=DEFAULT_MODEL,
+                messages=self._build_locator_messages(element_desc, element_html),
+                max_tokens=MAX_TOKENS_LOCATOR,
+                response_format={"type": "json_object"}
             )
-            
+
             result = json.loads(response.choices[0].message.content)
-            return [LocatorSuggestion(**s) for s in result["suggestions"]]
+            suggestions = [LocatorSuggestion(**s) for s in result["suggestions"]]
+            self._cache_response(cache_key, suggestions)
+            return suggestions
             
         except Exception as e:
             print(f"Error analyzing locators for {element_desc}: {e}")
             return self._generate_mock_locators(element_desc)
     
+    # Attributes that actually help the model pick a locator
+    _LOCATOR_ATTRS = ('id', 'name', 'class', 'type', 'placeholder', 'value',
+                      'href', 'aria-label', 'data-testid')
+
+    @classmethod
+    def _compact_element_html(cls, element: Any) -> str:
+        """Render an element as a minimal single tag for the prompt
+
+        str(element) can drag in arbitrarily deep children and attribute
+        noise; only the identifying attributes and a short text snippet
+        are worth the input tokens.
+        """
+        attrs = []
+        for attr in cls._LOCATOR_ATTRS:
+            value = element.get(attr)
+            if value:
+                if isinstance(value, list):
+                    value = ' '.join(value)
+                attrs.append(f'{attr}="{value}"')
+
+        text = element.get_text(strip=True)[:80]
+        attr_str = (' ' + ' '.join(attrs)) if attrs else ''
+        return f'<{element.name}{attr_str}>{text}</{element.name}>'
+
+    def _build_locator_messages(self, element_desc: str, element_html: str) -> List[Dict[str, str]]:
+        """Build the chat messages for a single element's suggestion request
+
+        The static instructions go first as the system message; only the
+        small dynamic payload varies per call, so the shared prefix stays
+        cacheable on the provider side.
+        """
+        return [
+            {"role": "system", "content": LOCATOR_SYSTEM_PROMPT},
+            {"role": "user", "content": _ELEMENT_USER_TMPL.substitute(desc=element_desc, html=element_html)},
+        ]
+
+    async def _suggest_locators_for_element_async(self, soup: BeautifulSoup, element_desc: str,
+                                                  semaphore: asyncio.Semaphore) -> List[LocatorSuggestion]:
+        """Async variant of _suggest_locators_for_element for concurrent dispatch"""
+        try:
+            if not self._async_client:
+                return self._generate_mock_locators(element_desc)
+
+            element = self._find_element_by_description(soup, element_desc)
+            if not element:
+                return []
+
+            element_html = self._compact_element_html(element)
+            cache_key = self._response_cache_key(element_desc, element_html)
+            cached = self._response_cache.get(cache_key)
+            if cached is not None:
+                return list(cached)
+
+            async with semaphore:
+                response = await self._async_client.chat.completions.create(
+                    model=DEFAULT_MODEL,
+                    messages=self._build_locator_messages(element_desc, element_html),
+                    max_tokens=MAX_TOKENS_LOCATOR,
+                    response_format={"type": "json_object"}
+                )
+
+            result = json.loads(response.choices[0].message.content)
+            suggestions = [LocatorSuggestion(**s) for s in result["suggestions"]]
+            self._cache_response(cache_key, suggestions)
+            return suggestions
+
+        except Exception as e:
+            print(f"Error analyzing locators for {element_desc}: {e}")
+            return self._generate_mock_locators(element_desc)
+
+    def _get_soup(self, html_content: str, strained: bool) -> BeautifulSoup:
+        """Return a cached parse of html_content
+
+        Strained soups (interactive tags only) serve the analysis paths;
+        validate_locator needs the full tree since id/class/css locators
+        can match any tag. A small bound keeps memory in check.
+        """
+        digest = hashlib.blake2b(html_content.encode('utf-8'), digest_size=16).hexdigest()
+        cache_key = (digest, strained)
+        soup = self._soup_cache.get(cache_key)
+        if soup is None:
+            parse_only = _INTERACTIVE_TAGS_STRAINER if strained else None
+            soup = BeautifulSoup(html_content, 'lxml', parse_only=parse_only)
+            if len(self._soup_cache) >= 8:
+                self._soup_cache.pop(next(iter(self._soup_cache)))
+            self._soup_cache[cache_key] = soup
+        return soup
+
+    @staticmethod
+    def _response_cache_key(element_desc: str, element_html: str) -> Tuple[str, str]:
+        """Stable cache key for an element's suggestion response"""
+        digest = hashlib.blake2b(element_html.encode('utf-8'), digest_size=16).hexdigest()
+        return (element_desc, digest)
+
+    def _cache_response(self, cache_key: Tuple[str, str], suggestions: List[LocatorSuggestion]):
+        """Store a suggestion response, evicting the oldest entry when full"""
+        if len(self._response_cache) >= 4096:
+            self._response_cache.pop(next(iter(self._response_cache)))
+        self._response_cache[cache_key] = tuple(suggestions)
+
+    async def analyze_page_locators_async(self, html_content: str, target_elements: List[str] = None,
+                                          max_concurrency: int = 8) -> Dict[str, List[LocatorSuggestion]]:
+        """Analyze HTML content with one concurrent API call per element
+
+        Alternative to the batched single-prompt path: wall time becomes
+        the slowest individual request instead of the sum, bounded by
+        max_concurrency to respect rate limits.
+        """
+        soup = self._get_soup(html_content, strained=True)
+
+        if not target_elements:
+            target_elements = self._find_interactive_elements(soup)
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+        results = await asyncio.gather(
+            *(self._suggest_locators_for_element_async(soup, desc, semaphore) for desc in target_elements)
+        )
+        return dict(zip(target_elements, results))
+
+    def analyze_page_locators_concurrent(self, html_content: str, target_elements: List[str] = None,
+                                         max_concurrency: int = 8) -> Dict[str, List[LocatorSuggestion]]:
+        """Sync wrapper around analyze_page_locators_async"""
+        return asyncio.run(self.analyze_page_locators_async(html_content, target_elements, max_concurrency))
+
     def _find_element_by_description(self, soup: BeautifulSoup, element_desc: str) -> Optional[Any]:
         """Find an element based on its description"""
         element_type, text = element_desc.split(": ", 1)
         
+        # Descriptions carry text captured with get_text(strip=True) in
+        # _find_interactive_elements, while .string keeps surrounding
+        # whitespace — strip before the case-insensitive equality check;
+        # still no regex engine on the hot path
+        text_lower = text.lower()
+        match = lambda v: bool(v) and v.strip().lower() == text_lower
+
         if element_type == "Button":
-            return soup.find(['button', 'input'], 
-                           string=re.compile(text, re.IGNORECASE)) or \
-                   soup.find(['button', 'input'], 
-                           value=re.compile(text, re.IGNORECASE))
-        
+            return soup.find(['button', 'input'], string=match) or \
+                   soup.find(['button', 'input'], value=match)
+
         elif element_type == "Link":
-            return soup.find('a', string=re.compile(text, re.IGNORECASE))
-        
+            return soup.find('a', string=match)
+
         elif element_type == "Input":
-            return soup.find('input', 
-                           placeholder=re.compile(text, re.IGNORECASE)) or \
-                   soup.find('input', 
-                           name=re.compile(text, re.IGNORECASE))
+            return soup.find('input', placeholder=match) or \
+                   soup.find('input', name=match)
         
         return None
     
@@ -204,8 +457,15 @@ class LocatorAnalyzer:
     
     def validate_locator(self, html_content: str, locator_type: str, locator_value: str) -> bool:
         """Validate if a locator works correctly"""
-        soup = BeautifulSoup(html_content, 'html.parser')
-        
+        # Reject trivially-invalid locators before paying for a parse.
+        # Only type/empty checks: content heuristics can't safely cover
+        # the full CSS/XPath grammar, and a wrong fast-path rejection
+        # flips the answer for locators the engines accept
+        if locator_type not in _VALID_LOCATOR_TYPES or not locator_value:
+            return False
+
+        soup = self._get_soup(html_content, strained=False)
+
         try:
             if locator_type == "id":
                 return soup.find(id=locator_value) is not None
@@ -216,40 +476,33 @@ class LocatorAnalyzer:
             elif locator_type == "css":
                 return soup.select(locator_value) != []
             elif locator_type == "xpath":
-                # Basic XPath validation (simplified)
-                return self._validate_xpath(soup, locator_value)
+                tree = self._get_tree(html_content)
+                return bool(tree.xpath(locator_value))
             else:
                 return False
         except Exception:
             return False
-    
-    def _validate_xpath(self, soup: BeautifulSoup, xpath: str) -> bool:
-        """Basic XPath validation (simplified implementation)"""
-        try:
-            # This is a simplified validation - in a real implementation,
-            # you would use lxml.etree for proper XPath evaluation
-            if xpath.startswith("//"):
-                tag_name = xpath.split("/")[2].split("[")[0]
-                return soup.find(tag_name) is not None
-            return True
-        except Exception:
-            return False
-    
+
+    def _get_tree(self, html_content: str) -> Any:
+        """Return a cached lxml tree for real XPath evaluation"""
+        digest = hashlib.blake2b(html_content.encode('utf-8'), digest_size=16).hexdigest()
+        tree = self._tree_cache.get(digest)
+        if tree is None:
+            tree = lxml_html.fromstring(html_content)
+            if len(self._tree_cache) >= 8:
+                self._tree_cache.pop(next(iter(self._tree_cache)))
+            self._tree_cache[digest] = tree
+        return tree
+
+
     def save_locator_suggestions(self, suggestions: Dict[str, List[LocatorSuggestion]], filename: str):
         """Save locator suggestions to a JSON file"""
-        data = {}
-        for element, locators in suggestions.items():
-            data[element] = []
-            for loc in locators:
-                data[element].append({
-                    "element_type": loc.element_type,
-                    "locator_value": loc.locator_value,
-                    "confidence": loc.confidence,
-                    "reason": loc.reason,
-                    "alternative_locators": loc.alternative_locators
-                })
-        
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
-        
-        print(f"Locator suggestions saved to {filename}") 
\ No newline at end of file
+        data = {
+            element: [asdict(loc) for loc in locators]
+            for element, locators in suggestions.items()
+        }
+
+        with open(filename, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+
+        print(f"Locator suggestions saved to {filename}")
\ No newline at end of file
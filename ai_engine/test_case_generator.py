@@ -3,16 +3,50 @@ AI Test Case Generator Module
 Generates test cases using AI models for web, mobile, and API testing
 """
 
+import asyncio
 import json
 import os
+import tempfile
+import time
 from typing import List, Dict, Any, Optional
 from dataclasses import dataclass
 import openai
+import orjson
 from dotenv import load_dotenv
 
 load_dotenv()
 
-@dataclass
+# Model and output budget are env-overridable; max_tokens is a hard
+# reservation on the provider side, so keep it near the real output size
+DEFAULT_MODEL = os.getenv("TESTMATE_MODEL", "gpt-4o-mini")
+MAX_TOKENS_TESTCASE = int(os.getenv("TESTMATE_MAX_TOKENS_TESTCASE", "1200"))
+
+# Shared rubric sent as a byte-identical system message on every call,
+# so the instructions are billed once per cached prefix instead of
+# being re-embedded in each user prompt
+TEST_CASE_SYSTEM_PROMPT = """You are a senior QA engineer generating comprehensive test cases.
+The user message is a JSON payload: {"kind": "web|mobile|api", ...target details...}.
+
+Cover at least the following areas for each kind:
+- web: functional, UI/UX, cross-browser compatibility, responsive design, accessibility
+- mobile: functional, UI/UX, performance, device compatibility, network conditions, battery usage
+- api: positive, negative, boundary value, performance, security, error handling
+
+Return the test cases in JSON format with the following structure:
+{
+    "test_cases": [
+        {
+            "name": "Test case name",
+            "description": "Detailed description",
+            "steps": ["Step 1", "Step 2", ...],
+            "expected_result": "Expected outcome",
+            "priority": "high|medium|low",
+            "tags": ["functional", "ui", ...]
+        }
+    ]
+}"""
+
+@dataclass(slots=True, frozen=True)
 class TestCase:
     """Test case data structure"""
     name: str
@@ -29,46 +63,36 @@ class TestCaseGenerator:
     def __init__(self, api_key: Optional[str] = None):
         """Initialize the test case generator with OpenAI API key"""
         self.api_key = api_key or os.getenv("OPENAI_API_KEY")
-        if self.api_key:
-            openai.api_key = self.api_key
+        # One client per instance reuses its httpx connection pool across
+        # calls instead of paying TCP+TLS setup per request
+        self._client = openai.OpenAI(api_key=self.api_key) if self.api_key else None
+        self._async_client = openai.AsyncOpenAI(api_key=self.api_key) if self.api_key else None
     
+    @staticmethod
+    def _build_messages(payload: Dict[str, Any]) -> List[Dict[str, str]]:
+        """Chat messages: shared system rubric plus a compact JSON payload"""
+        return [
+            {"role": "system", "content": TEST_CASE_SYSTEM_PROMPT},
+            {"role": "user", "content": json.dumps(payload, ensure_ascii=False)},
+        ]
+
+    def _build_web_prompt(self, page_url: str, page_content: str) -> Dict[str, Any]:
+        """Build the user payload for web test case generation"""
+        return {"kind": "web", "url": page_url, "content": page_content[:1000]}
+
     def generate_web_test_cases(self, page_url: str, page_content: str = "") -> List[TestCase]:
         """Generate web test cases for a given page"""
-        prompt = f"""
-        Generate comprehensive web test cases for the following page:
-        URL: {page_url}
-        Content: {page_content[:1000]}...
-        
-        Please generate test cases covering:
-        1. Functional testing
-        2. UI/UX testing
-        3. Cross-browser compatibility
-        4. Responsive design
-        5. Accessibility
-        
-        Return the test cases in JSON format with the following structure:
-        {{
-            "test_cases": [
-                {{
-                    "name": "Test case name",
-                    "description": "Detailed description",
-                    "steps": ["Step 1", "Step 2", ...],
-                    "expected_result": "Expected outcome",
-                    "priority": "high|medium|low",
-                    "tags": ["functional", "ui", ...]
-                }}
-            ]
-        }}
-        """
-        
+        payload = self._build_web_prompt(page_url, page_content)
+
         try:
             if not self.api_key:
                 return self._generate_mock_test_cases("web", page_url)
-            
-            response = openai.ChatCompletion.create(
-                model="gpt-3.5-turbo",
-                messages=[{"role": "user", "content": prompt}],
-                max_tokens=2000
+
+            response = self._client.chat.completions.create(
+                model=DEFAULT_MODEL,
+                messages=self._build_messages(payload),
+                max_tokens=MAX_TOKENS_TESTCASE,
+                response_format={"type": "json_object"}
             )
             
             result = json.loads(response.choices[0].message.content)
@@ -78,33 +102,28 @@ class TestCaseGenerator:
             print(f"Error generating web test cases: {e}")
             return self._generate_mock_test_cases("web", page_url)
     
+    def _build_mobile_prompt(self, app_info: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the user payload for mobile test case generation"""
+        return {
+            "kind": "mobile",
+            "name": app_info.get('name', 'Unknown'),
+            "platform": app_info.get('platform', 'Unknown'),
+            "features": app_info.get('features', []),
+        }
+
     def generate_mobile_test_cases(self, app_info: Dict[str, Any]) -> List[TestCase]:
         """Generate mobile test cases for a given app"""
-        prompt = f"""
-        Generate comprehensive mobile test cases for the following app:
-        App Name: {app_info.get('name', 'Unknown')}
-        Platform: {app_info.get('platform', 'Unknown')}
-        Features: {app_info.get('features', [])}
-        
-        Please generate test cases covering:
-        1. Functional testing
-        2. UI/UX testing
-        3. Performance testing
-        4. Device compatibility
-        5. Network conditions
-        6. Battery usage
-        
-        Return the test cases in JSON format.
-        """
-        
+        payload = self._build_mobile_prompt(app_info)
+
         try:
             if not self.api_key:
                 return self._generate_mock_test_cases("mobile", app_info.get('name', 'Unknown'))
-            
-            response = openai.ChatCompletion.create(
-                model="gpt-3.5-turbo",
-                messages=[{"role": "user", "content": prompt}],
-                max_tokens=2000
+
+            response = self._client.chat.completions.create(
+                model=DEFAULT_MODEL,
+                messages=self._build_messages(payload),
+                max_tokens=MAX_TOKENS_TESTCASE,
+                response_format={"type": "json_object"}
             )
             
             result = json.loads(response.choices[0].message.content)
@@ -114,33 +133,28 @@ class TestCaseGenerator:
             print(f"Error generating mobile test cases: {e}")
             return self._generate_mock_test_cases("mobile", app_info.get('name', 'Unknown'))
     
+    def _build_api_prompt(self, api_spec: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the user payload for API test case generation"""
+        return {
+            "kind": "api",
+            "base_url": api_spec.get('base_url', 'Unknown'),
+            "endpoints": api_spec.get('endpoints', []),
+            "methods": api_spec.get('methods', []),
+        }
+
     def generate_api_test_cases(self, api_spec: Dict[str, Any]) -> List[TestCase]:
         """Generate API test cases based on API specification"""
-        prompt = f"""
-        Generate comprehensive API test cases for the following API:
-        Base URL: {api_spec.get('base_url', 'Unknown')}
-        Endpoints: {api_spec.get('endpoints', [])}
-        Methods: {api_spec.get('methods', [])}
-        
-        Please generate test cases covering:
-        1. Positive testing
-        2. Negative testing
-        3. Boundary value testing
-        4. Performance testing
-        5. Security testing
-        6. Error handling
-        
-        Return the test cases in JSON format.
-        """
-        
+        payload = self._build_api_prompt(api_spec)
+
         try:
             if not self.api_key:
                 return self._generate_mock_test_cases("api", api_spec.get('base_url', 'Unknown'))
-            
-            response = openai.ChatCompletion.create(
-                model="gpt-3.5-turbo",
-                messages=[{"role": "user", "content": prompt}],
-                max_tokens=2000
+
+            response = self._client.chat.completions.create(
+                model=DEFAULT_MODEL,
+                messages=self._build_messages(payload),
+                max_tokens=MAX_TOKENS_TESTCASE,
+                response_format={"type": "json_object"}
             )
             
             result = json.loads(response.choices[0].message.content)
@@ -150,6 +164,140 @@ class TestCaseGenerator:
             print(f"Error generating API test cases: {e}")
             return self._generate_mock_test_cases("api", api_spec.get('base_url', 'Unknown'))
     
+    async def _agenerate_test_cases(self, test_type: str, payload: Dict[str, Any], fallback_target: str) -> List[TestCase]:
+        """Shared async request path for all three test types"""
+        try:
+            if not self._async_client:
+                return self._generate_mock_test_cases(test_type, fallback_target)
+
+            response = await self._async_client.chat.completions.create(
+                model=DEFAULT_MODEL,
+                messages=self._build_messages(payload),
+                max_tokens=MAX_TOKENS_TESTCASE,
+                response_format={"type": "json_object"}
+            )
+
+            result = json.loads(response.choices[0].message.content)
+            return [TestCase(**tc, test_type=test_type) for tc in result["test_cases"]]
+
+        except Exception as e:
+            print(f"Error generating {test_type} test cases: {e}")
+            return self._generate_mock_test_cases(test_type, fallback_target)
+
+    async def agenerate_web_test_cases(self, page_url: str, page_content: str = "") -> List[TestCase]:
+        """Async variant of generate_web_test_cases"""
+        payload = self._build_web_prompt(page_url, page_content)
+        return await self._agenerate_test_cases("web", payload, page_url)
+
+    async def agenerate_mobile_test_cases(self, app_info: Dict[str, Any]) -> List[TestCase]:
+        """Async variant of generate_mobile_test_cases"""
+        payload = self._build_mobile_prompt(app_info)
+        return await self._agenerate_test_cases("mobile", payload, app_info.get('name', 'Unknown'))
+
+    async def agenerate_api_test_cases(self, api_spec: Dict[str, Any]) -> List[TestCase]:
+        """Async variant of generate_api_test_cases"""
+        payload = self._build_api_prompt(api_spec)
+        return await self._agenerate_test_cases("api", payload, api_spec.get('base_url', 'Unknown'))
+
+    async def generate_all(self, web_ctx: Dict[str, Any], mobile_ctx: Dict[str, Any],
+                           api_ctx: Dict[str, Any]) -> List[List[TestCase]]:
+        """Generate web, mobile and API test cases concurrently
+
+        Wall time collapses to the slowest of the three requests
+        instead of their sum.
+        """
+        return await asyncio.gather(
+            self.agenerate_web_test_cases(**web_ctx),
+            self.agenerate_mobile_test_cases(app_info=mobile_ctx),
+            self.agenerate_api_test_cases(api_spec=api_ctx),
+        )
+
+    def generate_all_sync(self, web_ctx: Dict[str, Any], mobile_ctx: Dict[str, Any],
+                          api_ctx: Dict[str, Any]) -> List[List[TestCase]]:
+        """Sync wrapper around generate_all"""
+        return asyncio.run(self.generate_all(web_ctx, mobile_ctx, api_ctx))
+
+    def generate_test_cases_batch(self, targets: List[Dict[str, Any]],
+                                  poll_interval: float = 30.0) -> Dict[str, List[TestCase]]:
+        """Generate test cases for many targets via the OpenAI Batch API
+
+        Meant for bulk/offline jobs (e.g. CI generating suites for many
+        targets): batch jobs are not subject to per-request rate limits
+        and are billed at roughly half the online price.
+
+        Each target is a dict with a "kind" of web/mobile/api plus the
+        arguments of the matching generate_* method, and an optional
+        "custom_id". Returns test cases keyed by custom_id.
+        """
+        if not self._client:
+            raise RuntimeError("OpenAI API key is required for batch generation")
+
+        lines = []
+        kinds = {}
+        for i, target in enumerate(targets):
+            kind = target.get("kind", "web")
+            if kind == "web":
+                payload = self._build_web_prompt(target.get("page_url", ""), target.get("page_content", ""))
+            elif kind == "mobile":
+                payload = self._build_mobile_prompt(target.get("app_info", {}))
+            else:
+                payload = self._build_api_prompt(target.get("api_spec", {}))
+
+            custom_id = target.get("custom_id", f"testcase-{i}")
+            kinds[custom_id] = kind
+            lines.append(json.dumps({
+                "custom_id": custom_id,
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": DEFAULT_MODEL,
+                    "messages": self._build_messages(payload),
+                    "max_tokens": MAX_TOKENS_TESTCASE,
+                    "response_format": {"type": "json_object"},
+                },
+            }, ensure_ascii=False))
+
+        jsonl_path = None
+        try:
+            with tempfile.NamedTemporaryFile("wb", suffix=".jsonl", delete=False) as f:
+                jsonl_path = f.name
+                f.write("\n".join(lines).encode("utf-8"))
+            with open(jsonl_path, "rb") as f:
+                batch_file = self._client.files.create(file=f, purpose="batch")
+        finally:
+            if jsonl_path:
+                os.unlink(jsonl_path)
+
+        batch = self._client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
+        )
+
+        while batch.status not in ("completed", "failed", "expired", "cancelled"):
+            time.sleep(poll_interval)
+            batch = self._client.batches.retrieve(batch.id)
+
+        if batch.status != "completed":
+            raise RuntimeError(f"Batch {batch.id} finished with status {batch.status}")
+
+        results = {}
+        output = self._client.files.content(batch.output_file_id).text
+        for line in output.splitlines():
+            if not line.strip():
+                continue
+            entry = json.loads(line)
+            custom_id = entry["custom_id"]
+            try:
+                content = entry["response"]["body"]["choices"][0]["message"]["content"]
+                test_cases = json.loads(content)["test_cases"]
+                results[custom_id] = [TestCase(**tc, test_type=kinds.get(custom_id, "web"))
+                                      for tc in test_cases]
+            except Exception as e:
+                print(f"Error parsing batch result for {custom_id}: {e}")
+                results[custom_id] = []
+        return results
+
     def _generate_mock_test_cases(self, test_type: str, target: str) -> List[TestCase]:
         """Generate mock test cases when AI is not available"""
         mock_cases = {
@@ -201,19 +349,10 @@ class TestCaseGenerator:
     
     def save_test_cases(self, test_cases: List[TestCase], filename: str):
         """Save test cases to a JSON file"""
-        data = []
-        for tc in test_cases:
-            data.append({
-                "name": tc.name,
-                "description": tc.description,
-                "steps": tc.steps,
-                "expected_result": tc.expected_result,
-                "test_type": tc.test_type,
-                "priority": tc.priority,
-                "tags": tc.tags
-            })
-        
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
-        
-        print(f"Test cases saved to {filename}") 
\ No newline at end of file
+        # orjson walks the dataclass fields in C; no per-case dict rebuild
+        payload = orjson.dumps(test_cases, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_DATACLASS)
+
+        with open(filename, 'wb') as f:
+            f.write(payload)
+
+        print(f"Test cases saved to {filename}")
\ No newline at end of file
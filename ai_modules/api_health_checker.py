@@ -7,14 +7,51 @@ JSON dosyasından endpoint'leri okuyup sağlık kontrolü yapar.
 import json
 import asyncio
 import aiohttp
+import re
 import time
-from typing import Dict, List, Any, Optional
+
+try:
+    # C ile yazılmış encoder/decoder; büyük collection'larda ve rapor
+    # yazımında stdlib json'dan kat kat hızlı
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    # Büyük Postman export'larını tüm ağacı belleğe almadan, item item
+    # okumak için artımlı parser
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    # HTTP/2 desteği için opsiyonel; aynı host'a giden kontroller tek
+    # TCP+TLS bağlantısı üzerinden multiplex edilir
+    import httpx
+except ImportError:
+    httpx = None
+
+try:
+    # Kuruluysa aiohttp.AsyncResolver kullanılır: DNS sorguları default
+    # threadpool resolver yerine event loop içinde, bloklamadan çözülür
+    import aiodns
+except ImportError:
+    aiodns = None
+
+try:
+    # Şemayı derleyip Python kodu üretir; el yazması alan kontrollerinden
+    # kat kat hızlı doğrulama
+    import fastjsonschema
+except ImportError:
+    fastjsonschema = None
+from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime
 from dataclasses import dataclass
+import msgspec
 from urllib.parse import urljoin, urlparse
 import logging
 from reportlab.lib.pagesizes import letter, A4
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, PageBreak
+from reportlab.platypus import SimpleDocTemplate, LongTable, Paragraph, Spacer, Table, TableStyle, PageBreak
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
 from reportlab.lib import colors
@@ -25,7 +62,117 @@ import os
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-@dataclass
+# PDF stilleri değişmez konfigürasyon; her raporda yeniden kurmak yerine
+# modül yüklenirken bir kez oluşturulur
+_STYLES = getSampleStyleSheet()
+
+_TITLE_STYLE = ParagraphStyle(
+    'CustomTitle',
+    parent=_STYLES['Heading1'],
+    fontSize=18,
+    spaceAfter=30,
+    alignment=TA_CENTER,
+    textColor=colors.darkblue
+)
+
+_HEADING_STYLE = ParagraphStyle(
+    'CustomHeading',
+    parent=_STYLES['Heading2'],
+    fontSize=14,
+    spaceAfter=12,
+    spaceBefore=20,
+    textColor=colors.darkblue
+)
+
+_SUMMARY_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), colors.darkblue),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), 12),
+    ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+    ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
+    ('GRID', (0, 0), (-1, -1), 1, colors.black),
+    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+])
+
+_PERF_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), colors.darkgreen),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), 12),
+    ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+    ('BACKGROUND', (0, 1), (-1, -1), colors.lightgreen),
+    ('GRID', (0, 0), (-1, -1), 1, colors.black),
+    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+])
+
+# URL şema kontrolü için bir kez derlenen regex
+_URL_RE = re.compile(r'^https?://', re.IGNORECASE)
+
+# Endpoint tanımının beklenen şekli; fastjsonschema varsa import
+# sırasında derlenmiş validator'a çevrilir
+_ENDPOINT_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "name": {"type": "string"},
+        "url": {"type": "string"},
+        "method": {"type": "string"},
+        "headers": {"type": "object"},
+        "expected_status": {"type": "integer"},
+        "timeout": {"type": "integer"},
+        "description": {"type": ["string", "null"]},
+        "body_check": {"type": "boolean"},
+    },
+    "required": ["name", "url"],
+}
+
+_validate_endpoint = fastjsonschema.compile(_ENDPOINT_SCHEMA) if fastjsonschema is not None else None
+
+# ClientTimeout immutable; timeout değeri başına bir kez oluşturup tüm
+# isteklerde paylaş (10k endpoint'lik taramada 10k allocation yerine birkaç tane)
+_TIMEOUT_CACHE: Dict[int, aiohttp.ClientTimeout] = {}
+
+def _get_timeout(seconds: int) -> aiohttp.ClientTimeout:
+    """Verilen saniye için paylaşılan ClientTimeout döndür"""
+    timeout = _TIMEOUT_CACHE.get(seconds)
+    if timeout is None:
+        timeout = _TIMEOUT_CACHE[seconds] = aiohttp.ClientTimeout(total=seconds)
+    return timeout
+
+# Detay tablosundaki kolon kısaltma sınırları
+_MAX_NAME = 25
+_MAX_URL = 35
+
+# Sayfa genişliği ve kolon genişlikleri sabit; aritmetik render başına
+# değil import sırasında bir kez yapılır (sayfaya sığmazsa orantılı küçült)
+_PAGE_WIDTH = A4[0] - 2*inch
+_DETAIL_COL_WIDTHS = (1.5*inch, 2.2*inch, 0.7*inch, 0.7*inch, 0.8*inch, 0.8*inch)
+if sum(_DETAIL_COL_WIDTHS) > _PAGE_WIDTH:
+    _scale = _PAGE_WIDTH / sum(_DETAIL_COL_WIDTHS)
+    _DETAIL_COL_WIDTHS = tuple(w * _scale for w in _DETAIL_COL_WIDTHS)
+
+_DETAIL_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), colors.darkblue),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), 9),
+    ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+    ('BACKGROUND', (0, 1), (-1, -1), colors.white),
+    ('GRID', (0, 0), (-1, -1), 1, colors.black),
+    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+    ('FONTSIZE', (0, 1), (-1, -1), 8),
+    ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.lightgrey]),
+    ('WORDWRAP', (0, 0), (-1, -1), True),  # Kelime kaydırma
+    ('LEFTPADDING', (0, 0), (-1, -1), 3),  # Sol padding
+    ('RIGHTPADDING', (0, 0), (-1, -1), 3),  # Sağ padding
+])
+
+# slots=True: binlerce endpoint'te instance başına __dict__ maliyetini
+# kaldırır, attribute erişimi de hızlanır
+@dataclass(slots=True)
 class EndpointConfig:
     """Endpoint konfigürasyonu"""
     name: str
@@ -36,9 +183,14 @@ class EndpointConfig:
     expected_status: int = 200
     timeout: int = 30
     description: Optional[str] = None
+    # True ise GET ile body indirilir; False'ta GET yerine HEAD atılır ve
+    # boyut Content-Length'ten okunur (bant genişliği tasarrufu)
+    body_check: bool = False
 
-@dataclass
-class HealthCheckResult:
+# msgspec.Struct: C seviyesinde alan erişimi ve to_builtins ile tek
+# çağrıda dict'e dönüşüm; rename sayesinde rapor çıktısındaki "name"
+# anahtarı korunur
+class HealthCheckResult(msgspec.Struct, rename={"endpoint_name": "name"}):
     """Health check sonucu"""
     endpoint_name: str
     url: str
@@ -48,24 +200,73 @@ class HealthCheckResult:
     is_healthy: bool
     error_message: Optional[str] = None
     response_size: Optional[int] = None
-    timestamp: datetime = None
-    
-    def __post_init__(self):
-        if self.timestamp is None:
-            self.timestamp = datetime.now()
+    timestamp: datetime = msgspec.field(default_factory=datetime.now)
 
 class APIHealthChecker:
     """API Health Checker sınıfı"""
     
-    def __init__(self, config_file: str = "api_endpoints.json"):
+    def __init__(self, config_file: str = "api_endpoints.json", max_concurrency: int = 50,
+                 use_http2: bool = False):
         self.config_file = config_file
         self.endpoints: List[EndpointConfig] = []
         self.results: List[HealthCheckResult] = []
-        
+        # Aynı anda açık request sayısı sınırı; binlerce endpoint'te
+        # socket/FD patlamasını ve timeout zincirini önler
+        self.max_concurrency = max_concurrency
+        # httpx kuruluysa HTTP/2 multiplexing kullanılabilir; aiohttp
+        # varsayılan yol olarak kalır
+        self.use_http2 = use_http2 and httpx is not None
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._httpx_client = None
+        # Aynı sonuç listesi için rapor bir kez hesaplanır; JSON + PDF
+        # art arda kaydedilirken ikinci hesap bedava olur
+        self._cached_report: Optional[Dict[str, Any]] = None
+        self._cached_report_key: Optional[int] = None
+        # URL başına (ETag, Last-Modified, boyut); zamanlanmış koşularda
+        # conditional request atılır, 304 dönerse body hiç taşınmaz
+        self._etag_cache: Dict[str, Tuple[Optional[str], Optional[str], int]] = {}
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Paylaşılan ClientSession'ı döndür (gerekirse oluştur)
+
+        Tek session tüm endpoint kontrollerinde paylaşılır; connection
+        pool sayesinde DNS, TCP ve TLS maliyeti host başına bir kez ödenir.
+        """
+        if self._session is None or self._session.closed:
+            resolver = aiohttp.AsyncResolver() if aiodns is not None else None
+            connector = aiohttp.TCPConnector(
+                limit=self.max_concurrency,
+                limit_per_host=10,
+                resolver=resolver,
+                use_dns_cache=True,
+                ttl_dns_cache=300
+            )
+            self._session = aiohttp.ClientSession(connector=connector)
+        return self._session
+
+    def _get_httpx_client(self):
+        """Paylaşılan HTTP/2 client'ı döndür (gerekirse oluştur)"""
+        if self._httpx_client is None or self._httpx_client.is_closed:
+            self._httpx_client = httpx.AsyncClient(
+                http2=True,
+                limits=httpx.Limits(max_connections=self.max_concurrency, max_keepalive_connections=50)
+            )
+        return self._httpx_client
+
+    async def close(self):
+        """Paylaşılan session'ı kapat"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        if self._httpx_client is not None and not self._httpx_client.is_closed:
+            await self._httpx_client.aclose()
+        self._httpx_client = None
+
+
     def load_endpoints_from_json(self, json_content: str) -> List[EndpointConfig]:
         """JSON içeriğinden endpoint'leri yükle"""
         try:
-            data = json.loads(json_content)
+            data = orjson.loads(json_content) if orjson is not None else json.loads(json_content)
             endpoints = []
             
             # JSON yapısını kontrol et
@@ -102,96 +303,127 @@ class APIHealthChecker:
             logger.error(f"Endpoint yükleme hatası: {e}")
             raise
     
+    def load_endpoints_from_stream(self, fp) -> List[EndpointConfig]:
+        """Postman collection'ını dosya akışından artımlı olarak yükle
+
+        ijson ile collection'daki item'lar tek tek okunur; bellekte aynı
+        anda ham metin + tüm parse ağacı yerine yalnızca işlenen item
+        tutulur. Çok MB'lik export'larda tepe bellek kullanımını sınırlar.
+        """
+        if ijson is None:
+            # ijson yoksa tüm içeriği okuyup normal yoldan yükle
+            return self.load_endpoints_from_json(fp.read())
+
+        endpoints = []
+        for item in ijson.items(fp, 'item.item'):
+            endpoints.extend(self._endpoints_from_postman_items([item]))
+
+        if not endpoints:
+            raise ValueError("Hiç endpoint bulunamadı. JSON formatını kontrol edin.")
+
+        self.endpoints = endpoints
+        logger.info(f"{len(endpoints)} endpoint yüklendi")
+        return endpoints
+
     def _parse_postman_collection(self, collection_data: Dict[str, Any]) -> List[EndpointConfig]:
         """Postman collection'ından endpoint'leri parse et"""
+        return self._endpoints_from_postman_items(collection_data.get("item", []))
+
+    def _endpoints_from_postman_items(self, items) -> List[EndpointConfig]:
+        """Postman item listesinden (iç içe folder'lar dahil) endpoint'leri çıkar"""
         endpoints = []
-        
-        def extract_endpoints_from_items(items):
-            for item in items:
-                if "item" in item:
-                    # Folder içindeki item'lar
-                    extract_endpoints_from_items(item["item"])
-                elif "request" in item:
-                    # Endpoint
-                    request = item["request"]
-                    name = item.get("name", "Unnamed Endpoint")
-                    
-                    # URL'yi oluştur
-                    url_obj = request.get("url", {})
-                    if isinstance(url_obj, str):
-                        url = url_obj
-                    elif isinstance(url_obj, dict):
-                        # Postman URL objesi
-                        protocol = url_obj.get("protocol", "https")
-                        host = url_obj.get("host", [])
-                        path = url_obj.get("path", [])
-                        
-                        if isinstance(host, list):
-                            host = ".".join(host)
-                        
-                        if isinstance(path, list):
-                            path = "/".join(path)
-                        
-                        url = f"{protocol}://{host}/{path}"
-                    else:
-                        continue
-                    
-                    # Method
-                    method = request.get("method", "GET").upper()
-                    
-                    # Headers
-                    headers = {}
-                    for header in request.get("header", []):
-                        if "key" in header and "value" in header:
-                            headers[header["key"]] = header["value"]
-                    
-                    # Body
-                    body = None
-                    body_obj = request.get("body", {})
-                    if body_obj and "mode" in body_obj:
-                        if body_obj["mode"] == "urlencoded":
-                            body = {}
-                            for param in body_obj.get("urlencoded", []):
-                                if "key" in param and "value" in param:
-                                    body[param["key"]] = param["value"]
-                        elif body_obj["mode"] == "raw":
-                            try:
-                                body = json.loads(body_obj.get("raw", "{}"))
-                            except:
-                                body = body_obj.get("raw", "")
-                    
-                    # Endpoint oluştur
-                    endpoint = EndpointConfig(
-                        name=name,
-                        url=url,
-                        method=method,
-                        headers=headers,
-                        body=body,
-                        expected_status=200,
-                        timeout=30,
-                        description=f"Postman: {name}"
-                    )
+        for item in items:
+            if "item" in item:
+                # Folder içindeki item'lar
+                endpoints.extend(self._endpoints_from_postman_items(item["item"]))
+            elif "request" in item:
+                endpoint = self._endpoint_from_postman_item(item)
+                if endpoint is not None:
                     endpoints.append(endpoint)
-        
-        # Collection'daki item'ları işle
-        extract_endpoints_from_items(collection_data.get("item", []))
-        
         return endpoints
+
+    def _endpoint_from_postman_item(self, item: Dict[str, Any]) -> Optional[EndpointConfig]:
+        """Tek Postman request item'ından EndpointConfig oluştur"""
+        request = item["request"]
+        name = item.get("name", "Unnamed Endpoint")
+
+        # URL'yi oluştur
+        url_obj = request.get("url", {})
+        if isinstance(url_obj, str):
+            url = url_obj
+        elif isinstance(url_obj, dict):
+            # Postman URL objesi
+            protocol = url_obj.get("protocol", "https")
+            host = url_obj.get("host", [])
+            path = url_obj.get("path", [])
+
+            if isinstance(host, list):
+                host = ".".join(host)
+
+            if isinstance(path, list):
+                path = "/".join(path)
+
+            url = f"{protocol}://{host}/{path}"
+        else:
+            return None
+
+        # Method
+        method = request.get("method", "GET").upper()
+
+        # Headers
+        headers = {}
+        for header in request.get("header", []):
+            if "key" in header and "value" in header:
+                headers[header["key"]] = header["value"]
+
+        # Body
+        body = None
+        body_obj = request.get("body", {})
+        if body_obj and "mode" in body_obj:
+            if body_obj["mode"] == "urlencoded":
+                body = {}
+                for param in body_obj.get("urlencoded", []):
+                    if "key" in param and "value" in param:
+                        body[param["key"]] = param["value"]
+            elif body_obj["mode"] == "raw":
+                try:
+                    body = json.loads(body_obj.get("raw", "{}"))
+                except:
+                    body = body_obj.get("raw", "")
+
+        return EndpointConfig(
+            name=name,
+            url=url,
+            method=method,
+            headers=headers,
+            body=body,
+            expected_status=200,
+            timeout=30,
+            description=f"Postman: {name}"
+        )
     
     def _parse_endpoint(self, data: Dict[str, Any]) -> EndpointConfig:
         """Tek endpoint'i parse et"""
-        if not isinstance(data, dict):
-            raise ValueError(f"Endpoint verisi dict olmalı, {type(data)} verildi")
-        
-        # Gerekli alanları kontrol et
-        if "name" not in data:
-            raise ValueError("Endpoint'te 'name' alanı eksik")
-        if "url" not in data:
-            raise ValueError("Endpoint'te 'url' alanı eksik")
-        
+        if _validate_endpoint is not None:
+            # Derlenmiş şema: tek çağrıda tip + zorunlu alan kontrolü
+            try:
+                _validate_endpoint(data)
+            except fastjsonschema.JsonSchemaException as e:
+                raise ValueError(f"Geçersiz endpoint tanımı: {e.message}")
+        else:
+            if not isinstance(data, dict):
+                raise ValueError(f"Endpoint verisi dict olmalı, {type(data)} verildi")
+
+            # Gerekli alanları kontrol et
+            if "name" not in data:
+                raise ValueError("Endpoint'te 'name' alanı eksik")
+            if "url" not in data:
+                raise ValueError("Endpoint'te 'url' alanı eksik")
+
+
         # URL formatını kontrol et
         url = data["url"]
-        if not url.startswith(('http://', 'https://')):
+        if not _URL_RE.match(url):
             raise ValueError(f"Geçersiz URL formatı: {url}. http:// veya https:// ile başlamalı")
         
         return EndpointConfig(
@@ -202,50 +434,93 @@ class APIHealthChecker:
             body=data.get("body"),
             expected_status=int(data.get("expected_status", 200)),
             timeout=int(data.get("timeout", 30)),
-            description=data.get("description")
+            description=data.get("description"),
+            body_check=bool(data.get("body_check", False))
         )
     
-    async def check_single_endpoint(self, endpoint: EndpointConfig) -> HealthCheckResult:
+    async def check_single_endpoint(self, endpoint: EndpointConfig,
+                                    session: Optional[aiohttp.ClientSession] = None) -> HealthCheckResult:
         """Tek endpoint'i kontrol et"""
+        if self.use_http2 and session is None:
+            return await self._check_single_endpoint_httpx(endpoint)
+
         start_time = time.time()
-        
+
         try:
-            async with aiohttp.ClientSession() as session:
-                # Request parametrelerini hazırla
-                request_kwargs = {
-                    "timeout": aiohttp.ClientTimeout(total=endpoint.timeout),
-                    "headers": endpoint.headers or {}
-                }
-                
-                # Body varsa ekle
-                if endpoint.body and endpoint.method in ["POST", "PUT", "PATCH"]:
-                    request_kwargs["json"] = endpoint.body
-                
-                # Request'i gönder
-                async with session.request(
-                    endpoint.method, 
-                    endpoint.url, 
-                    **request_kwargs
-                ) as response:
-                    response_time = time.time() - start_time
-                    
-                    # Response body'yi oku
-                    response_body = await response.read()
-                    response_size = len(response_body)
-                    
-                    # Sonucu oluştur
+            if session is None:
+                session = await self._get_session()
+
+            # Request parametrelerini hazırla; önceki koşudan validator
+            # varsa conditional request'e çevir
+            headers = dict(endpoint.headers or {})
+            cached_validators = self._etag_cache.get(endpoint.url)
+            if cached_validators:
+                etag, last_modified, _ = cached_validators
+                if etag:
+                    headers['If-None-Match'] = etag
+                if last_modified:
+                    headers['If-Modified-Since'] = last_modified
+
+            request_kwargs = {
+                "timeout": _get_timeout(endpoint.timeout),
+                "headers": headers
+            }
+
+            # Body varsa ekle
+            if endpoint.body and endpoint.method in ["POST", "PUT", "PATCH"]:
+                request_kwargs["json"] = endpoint.body
+
+            # Sağlık kontrolünde çoğunlukla sadece status code önemli:
+            # body_check istenmediyse GET yerine HEAD at, body hiç taşınmasın
+            method = endpoint.method
+            if method == "GET" and not endpoint.body_check:
+                method = "HEAD"
+
+            # Request'i gönder
+            async with session.request(
+                method,
+                endpoint.url,
+                **request_kwargs
+            ) as response:
+                response_time = time.time() - start_time
+
+                if response.status == 304:
+                    # İçerik değişmemiş: sağlıklı say, boyutu cache'ten al
+                    response_size = cached_validators[2] if cached_validators else 0
+                    is_healthy = True
+                elif method == "HEAD":
+                    # Boyutu header'dan al, body indirme
+                    response_size = int(response.headers.get('Content-Length', 0))
+                    is_healthy = response.status == endpoint.expected_status
+                else:
+                    # Content-Length varsa body'yi belleğe almadan boyutu
+                    # header'dan al; yoksa okuyup ölç
+                    content_length = response.headers.get('Content-Length')
+                    if content_length is not None:
+                        response_size = int(content_length)
+                        response.release()
+                    else:
+                        response_size = len(await response.read())
                     is_healthy = response.status == endpoint.expected_status
-                    
-                    return HealthCheckResult(
-                        endpoint_name=endpoint.name,
-                        url=endpoint.url,
-                        method=endpoint.method,
-                        status_code=response.status,
-                        response_time=response_time,
-                        is_healthy=is_healthy,
-                        response_size=response_size
-                    )
-                    
+
+                # 200'de validator'ları sakla: sonraki koşu conditional olur
+                if response.status == 200:
+                    etag = response.headers.get('ETag')
+                    last_modified = response.headers.get('Last-Modified')
+                    if etag or last_modified:
+                        self._etag_cache[endpoint.url] = (etag, last_modified, response_size)
+
+                return HealthCheckResult(
+                    endpoint_name=endpoint.name,
+                    url=endpoint.url,
+                    method=endpoint.method,
+                    status_code=response.status,
+                    response_time=response_time,
+                    is_healthy=is_healthy,
+                    response_size=response_size
+                )
+
+
         except asyncio.TimeoutError:
             response_time = time.time() - start_time
             return HealthCheckResult(
@@ -282,33 +557,110 @@ class APIHealthChecker:
                 error_message=f"Unexpected error: {str(e)}"
             )
     
+    async def _check_single_endpoint_httpx(self, endpoint: EndpointConfig) -> HealthCheckResult:
+        """Tek endpoint'i HTTP/2 üzerinden kontrol et
+
+        Aynı host'a giden tüm kontroller tek bağlantı üzerinde multiplex
+        edilir; handshake ve socket sayısı host başına bire iner.
+        """
+        start_time = time.time()
+
+        try:
+            client = self._get_httpx_client()
+
+            request_kwargs = {
+                "timeout": httpx.Timeout(endpoint.timeout),
+                "headers": endpoint.headers or {}
+            }
+
+            if endpoint.body and endpoint.method in ["POST", "PUT", "PATCH"]:
+                request_kwargs["json"] = endpoint.body
+
+            # body_check istenmediyse GET yerine HEAD (bkz. aiohttp yolu)
+            method = endpoint.method
+            if method == "GET" and not endpoint.body_check:
+                method = "HEAD"
+
+            response = await client.request(method, endpoint.url, **request_kwargs)
+            response_time = time.time() - start_time
+
+            if method == "HEAD":
+                response_size = int(response.headers.get('Content-Length', 0))
+            else:
+                response_size = len(response.content)
+
+            return HealthCheckResult(
+                endpoint_name=endpoint.name,
+                url=endpoint.url,
+                method=endpoint.method,
+                status_code=response.status_code,
+                response_time=response_time,
+                is_healthy=response.status_code == endpoint.expected_status,
+                response_size=response_size
+            )
+
+        except httpx.TimeoutException:
+            response_time = time.time() - start_time
+            return HealthCheckResult(
+                endpoint_name=endpoint.name,
+                url=endpoint.url,
+                method=endpoint.method,
+                status_code=None,
+                response_time=response_time,
+                is_healthy=False,
+                error_message="Timeout - Endpoint yanıt vermedi"
+            )
+
+        except httpx.HTTPError as e:
+            response_time = time.time() - start_time
+            return HealthCheckResult(
+                endpoint_name=endpoint.name,
+                url=endpoint.url,
+                method=endpoint.method,
+                status_code=None,
+                response_time=response_time,
+                is_healthy=False,
+                error_message=f"Connection error: {str(e)}"
+            )
+
+        except Exception as e:
+            response_time = time.time() - start_time
+            return HealthCheckResult(
+                endpoint_name=endpoint.name,
+                url=endpoint.url,
+                method=endpoint.method,
+                status_code=None,
+                response_time=response_time,
+                is_healthy=False,
+                error_message=f"Unexpected error: {str(e)}"
+            )
+
     async def check_all_endpoints(self) -> List[HealthCheckResult]:
         """Tüm endpoint'leri kontrol et"""
         logger.info(f"{len(self.endpoints)} endpoint kontrol ediliyor...")
-        
-        # Tüm endpoint'leri paralel olarak kontrol et
-        tasks = [self.check_single_endpoint(endpoint) for endpoint in self.endpoints]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-        
-        # Exception'ları handle et
-        self.results = []
-        for i, result in enumerate(results):
-            if isinstance(result, Exception):
-                # Exception durumunda hata sonucu oluştur
-                endpoint = self.endpoints[i]
-                error_result = HealthCheckResult(
-                    endpoint_name=endpoint.name,
-                    url=endpoint.url,
-                    method=endpoint.method,
-                    status_code=None,
-                    response_time=0.0,
-                    is_healthy=False,
-                    error_message=f"Check failed: {str(result)}"
-                )
-                self.results.append(error_result)
-            else:
-                self.results.append(result)
-        
+
+        # Yeni koşuda eski rapor cache'i geçersiz
+        self._cached_report = None
+        self._cached_report_key = None
+        
+        # Tüm endpoint'leri paylaşılan session üzerinden, semaphore ile
+        # sınırlı paralellikte kontrol et
+        session = None if self.use_http2 else await self._get_session()
+        sem = asyncio.Semaphore(self.max_concurrency)
+
+        async def check_bounded(endpoint: EndpointConfig) -> HealthCheckResult:
+            async with sem:
+                return await self.check_single_endpoint(endpoint, session)
+
+        # check_single_endpoint tüm exception'ları kendi içinde yakalayıp
+        # HealthCheckResult döndürdüğü için gather(return_exceptions=True)
+        # + exception'dan sonuç üretme döngüsüne gerek yok
+        async with asyncio.TaskGroup() as tg:
+            tasks = [tg.create_task(check_bounded(endpoint)) for endpoint in self.endpoints]
+
+        self.results = [task.result() for task in tasks]
+
+
         logger.info(f"Health check tamamlandı. {len([r for r in self.results if r.is_healthy])}/{len(self.results)} endpoint sağlıklı")
         return self.results
     
@@ -316,26 +668,42 @@ class APIHealthChecker:
         """Health check raporu oluştur"""
         if not self.results:
             return {"error": "Henüz health check yapılmadı"}
-        
+
+        # Aynı sonuç listesi için daha önce hesaplanan raporu döndür
+        if self._cached_report is not None and self._cached_report_key == id(self.results):
+            return self._cached_report
+
         total_endpoints = len(self.results)
-        healthy_endpoints = len([r for r in self.results if r.is_healthy])
-        failed_endpoints = total_endpoints - healthy_endpoints
-        
-        # Ortalama response time
-        response_times = [r.response_time for r in self.results if r.response_time > 0]
-        avg_response_time = sum(response_times) / len(response_times) if response_times else 0
-        
-        # En hızlı ve en yavaş endpoint'ler
-        fastest_endpoint = min(self.results, key=lambda x: x.response_time) if self.results else None
-        slowest_endpoint = max(self.results, key=lambda x: x.response_time) if self.results else None
-        
-        # Status code dağılımı
+
+        # Tüm istatistikleri tek geçişte topla: sağlıklı sayısı, response
+        # time toplamı, en hızlı/en yavaş ve status code dağılımı
+        healthy_endpoints = 0
+        rt_sum = 0.0
+        rt_count = 0
+        fastest_endpoint = None
+        slowest_endpoint = None
         status_codes = {}
-        for result in self.results:
-            if result.status_code:
-                status_codes[result.status_code] = status_codes.get(result.status_code, 0) + 1
+
+        for r in self.results:
+            if r.is_healthy:
+                healthy_endpoints += 1
+            if r.response_time > 0:
+                rt_sum += r.response_time
+                rt_count += 1
+            if fastest_endpoint is None or r.response_time < fastest_endpoint.response_time:
+                fastest_endpoint = r
+            if slowest_endpoint is None or r.response_time > slowest_endpoint.response_time:
+                slowest_endpoint = r
+            if r.status_code:
+                # Anahtar string tutulur: orjson int anahtarları reddeder,
+                # stdlib json ise zaten string'e çevirip yazıyordu
+                key = str(r.status_code)
+                status_codes[key] = status_codes.get(key, 0) + 1
+
+        failed_endpoints = total_endpoints - healthy_endpoints
+        avg_response_time = rt_sum / rt_count if rt_count else 0
         
-        return {
+        report = {
             "summary": {
                 "total_endpoints": total_endpoints,
                 "healthy_endpoints": healthy_endpoints,
@@ -355,21 +723,14 @@ class APIHealthChecker:
                 }
             },
             "status_codes": status_codes,
-            "detailed_results": [
-                {
-                    "name": r.endpoint_name,
-                    "url": r.url,
-                    "method": r.method,
-                    "status_code": r.status_code,
-                    "response_time": round(r.response_time, 3),
-                    "is_healthy": r.is_healthy,
-                    "error_message": r.error_message,
-                    "response_size": r.response_size,
-                    "timestamp": r.timestamp.isoformat()
-                }
-                for r in self.results
-            ]
+            # Alan alan dict kurmak yerine msgspec C tarafında dönüştürür;
+            # datetime alanları ISO formatına kendisi çevirir
+            "detailed_results": msgspec.to_builtins(self.results)
         }
+
+        self._cached_report = report
+        self._cached_report_key = id(self.results)
+        return report
     
     def save_results_to_json(self, filename: str = None) -> str:
         """Sonuçları JSON dosyasına kaydet"""
@@ -378,53 +739,33 @@ class APIHealthChecker:
             filename = f"api_health_check_{timestamp}.json"
         
         report = self.generate_report()
-        
+
         with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(report, f, indent=2, ensure_ascii=False)
-        
+            if orjson is not None:
+                f.write(orjson.dumps(report, option=orjson.OPT_INDENT_2).decode())
+            else:
+                json.dump(report, f, indent=2, ensure_ascii=False)
+
         logger.info(f"Health check raporu kaydedildi: {filename}")
         return filename
     
-    def save_results_to_pdf(self, filename: str = None) -> str:
-        """Sonuçları PDF dosyasına kaydet"""
-        if filename is None:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"api_health_check_{timestamp}.pdf"
-        
+    def _build_pdf_story(self, filename: str):
+        """PDF dokümanını ve story'sini kur (render hariç)
+
+        Story kurulumu ucuz; asıl maliyetli doc.build çağrısı ayrı
+        tutulur ki async sarmalayıcı onu thread'e taşıyabilsin.
+        """
         report = self.generate_report()
-        
+
         # PDF oluştur
         doc = SimpleDocTemplate(filename, pagesize=A4)
         story = []
         
-        # Stil tanımlamaları - basit yaklaşım
-        styles = getSampleStyleSheet()
-        
-        # Başlık stili
-        title_style = ParagraphStyle(
-            'CustomTitle',
-            parent=styles['Heading1'],
-            fontSize=18,
-            spaceAfter=30,
-            alignment=TA_CENTER,
-            textColor=colors.darkblue
-        )
-        
-        # Alt başlık stili
-        heading_style = ParagraphStyle(
-            'CustomHeading',
-            parent=styles['Heading2'],
-            fontSize=14,
-            spaceAfter=12,
-            spaceBefore=20,
-            textColor=colors.darkblue
-        )
-        
-        # Normal metin stili
-        normal_style = styles['Normal']
-        
+        # Stiller modül seviyesinde bir kez oluşturuluyor
+        normal_style = _STYLES['Normal']
+
         # Başlık
-        title = Paragraph("API Health Check Report", title_style)
+        title = Paragraph("API Health Check Report", _TITLE_STYLE)
         story.append(title)
         story.append(Spacer(1, 20))
         
@@ -440,19 +781,9 @@ class APIHealthChecker:
         ]
         
         summary_table = Table(summary_data, colWidths=[2*inch, 3*inch])
-        summary_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.darkblue),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 12),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ]))
-        
-        story.append(Paragraph("Summary Information", heading_style))
+        summary_table.setStyle(_SUMMARY_TABLE_STYLE)
+
+        story.append(Paragraph("Summary Information", _HEADING_STYLE))
         story.append(summary_table)
         story.append(Spacer(1, 20))
         
@@ -466,110 +797,91 @@ class APIHealthChecker:
             ]
             
             perf_table = Table(performance_data, colWidths=[2*inch, 3*inch])
-            perf_table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), colors.darkgreen),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, 0), 12),
-                ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-                ('BACKGROUND', (0, 1), (-1, -1), colors.lightgreen),
-                ('GRID', (0, 0), (-1, -1), 1, colors.black),
-                ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-            ]))
-            
-            story.append(Paragraph("Performance Information", heading_style))
+            perf_table.setStyle(_PERF_TABLE_STYLE)
+
+            story.append(Paragraph("Performance Information", _HEADING_STYLE))
             story.append(perf_table)
             story.append(Spacer(1, 20))
         
         # Detaylı sonuçlar
-        story.append(Paragraph("Detailed Results", heading_style))
-        
-        # Tablo başlıkları
-        detailed_results = report['detailed_results']
-        if detailed_results:
+        story.append(Paragraph("Detailed Results", _HEADING_STYLE))
+
+        # Satırları generate_report'un detailed_results dict listesi yerine
+        # doğrudan self.results üzerinden kur; ara liste JSON çıktısı için,
+        # PDF'de ikinci bir kopya tutmaya gerek yok
+        error_results = []
+        if self.results:
             table_data = [["Endpoint", "URL", "Method", "Status", "Time (s)", "Status"]]
-            
-            # Endpoint adlarının maksimum uzunluğunu bul
-            max_name_length = max(len(result['name']) for result in detailed_results) if detailed_results else 20
-            max_name_length = min(max_name_length, 25)  # Maksimum 25 karakter
-            
-            for result in detailed_results:
-                status_text = "Healthy" if result['is_healthy'] else "Failed"
-                
-                # Endpoint adını kısalt
-                endpoint_name = result['name']
-                if len(endpoint_name) > max_name_length:
-                    endpoint_name = endpoint_name[:max_name_length-3] + "..."
-                
-                # URL'yi kısalt
-                url = result['url']
-                if len(url) > 35:
-                    url = url[:32] + "..."
-                
+
+            # Tek geçiş: ad/URL kısaltma sabit sınırlarla satır kurulumuna
+            # gömülü; hata listesi de aynı döngüde toplanıyor
+            for r in self.results:
+                status_text = "Healthy" if r.is_healthy else "Failed"
+                if not r.is_healthy and r.error_message:
+                    error_results.append(r)
+
+                endpoint_name = r.endpoint_name
+                if len(endpoint_name) > _MAX_NAME:
+                    endpoint_name = endpoint_name[:_MAX_NAME-3] + "..."
+
+                url = r.url
+                if len(url) > _MAX_URL:
+                    url = url[:_MAX_URL-3] + "..."
+
                 table_data.append([
                     endpoint_name,
                     url,
-                    result['method'],
-                    str(result['status_code']) if result['status_code'] else "N/A",
-                    f"{result['response_time']:.3f}",
+                    r.method,
+                    str(r.status_code) if r.status_code else "N/A",
+                    f"{r.response_time:.3f}",
                     status_text
                 ])
             
-            # Dinamik sütun genişlikleri hesapla
-            page_width = A4[0] - 2*inch  # Sayfa genişliği - kenar boşlukları
-            col_widths = [
-                min(1.5*inch, max_name_length * 0.1*inch),  # Endpoint - dinamik
-                2.2*inch,  # URL
-                0.7*inch,  # Method
-                0.7*inch,  # Status
-                0.8*inch,  # Time
-                0.8*inch   # Status
-            ]
-            
-            # Toplam genişliği kontrol et ve ayarla
-            total_width = sum(col_widths)
-            if total_width > page_width:
-                # Orantılı olarak küçült
-                scale_factor = page_width / total_width
-                col_widths = [w * scale_factor for w in col_widths]
-            
-            # Tablo stilini ayarla
-            table = Table(table_data, colWidths=col_widths)
-            table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), colors.darkblue),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, 0), 9),
-                ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-                ('BACKGROUND', (0, 1), (-1, -1), colors.white),
-                ('GRID', (0, 0), (-1, -1), 1, colors.black),
-                ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-                ('FONTSIZE', (0, 1), (-1, -1), 8),
-                ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.lightgrey]),
-                ('WORDWRAP', (0, 0), (-1, -1), True),  # Kelime kaydırma
-                ('LEFTPADDING', (0, 0), (-1, -1), 3),  # Sol padding
-                ('RIGHTPADDING', (0, 0), (-1, -1), 3),  # Sağ padding
-            ]))
-            
+            # LongTable çok satırlı tabloları tüm veriyi buffer'lamadan
+            # sayfalara böler; kolon genişlikleri modül sabiti
+            table = LongTable(table_data, colWidths=_DETAIL_COL_WIDTHS)
+            table.setStyle(_DETAIL_TABLE_STYLE)
+
             story.append(table)
             story.append(Spacer(1, 20))
-        
+
         # Hata mesajları (varsa)
-        error_results = [r for r in detailed_results if not r['is_healthy'] and r['error_message']]
         if error_results:
-            story.append(Paragraph("Error Details", heading_style))
-            
-            for result in error_results:
-                error_text = f"<b>{result['name']}</b> ({result['url']}): {result['error_message']}"
+            story.append(Paragraph("Error Details", _HEADING_STYLE))
+
+            for r in error_results:
+                error_text = f"<b>{r.endpoint_name}</b> ({r.url}): {r.error_message}"
                 story.append(Paragraph(error_text, normal_style))
                 story.append(Spacer(1, 6))
         
-        # PDF'i oluştur
+        return doc, story
+
+    def save_results_to_pdf(self, filename: str = None) -> str:
+        """Sonuçları PDF dosyasına kaydet"""
+        if filename is None:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            filename = f"api_health_check_{timestamp}.pdf"
+
+        doc, story = self._build_pdf_story(filename)
         doc.build(story)
         logger.info(f"PDF raporu kaydedildi: {filename}")
         return filename
+
+    async def save_results_to_pdf_async(self, filename: str = None) -> str:
+        """Sonuçları PDF dosyasına asenkron kaydet
+
+        reportlab'in CPU-ağırlıklı doc.build çağrısı thread'e taşınır;
+        event loop bloklanmaz, JSON kaydı veya bir sonraki health check
+        sweep'i ile paralel çalışabilir.
+        """
+        if filename is None:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            filename = f"api_health_check_{timestamp}.pdf"
+
+        doc, story = self._build_pdf_story(filename)
+        await asyncio.to_thread(doc.build, story)
+        logger.info(f"PDF raporu kaydedildi: {filename}")
+        return filename
     
     def get_sample_json_template(self) -> str:
         """Örnek JSON template döndür"""
@@ -654,7 +966,10 @@ async def test_health_checker():
     # JSON'a kaydet
     filename = checker.save_results_to_json()
     print(f"Rapor kaydedildi: {filename}")
-    
+
+    # Paylaşılan session'ı kapat
+    await checker.close()
+
     return results
 
 if __name__ == "__main__":
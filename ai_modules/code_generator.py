@@ -2,211 +2,315 @@ import os
 import json
 from typing import List, Dict, Any, Optional
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from types import MappingProxyType
 import re
 
-class CodeGenerator:
-    """Excel test senaryolarından otomasyon kodu üreten sınıf"""
-    
-    def __init__(self):
-        self.template_dir = "templates"
-        self.output_dir = "generated_tests"
-        self.framework_templates = {
-            "selenium": {
-                "imports": [
-                    "from selenium import webdriver",
-                    "from selenium.webdriver.common.by import By",
-                    "from selenium.webdriver.support.ui import WebDriverWait",
-                    "from selenium.webdriver.support import expected_conditions as EC",
-                    "from selenium.webdriver.common.keys import Keys",
-                    "import time",
-                    "import pytest"
-                ],
-                "setup": "self.driver = webdriver.Chrome()",
-                "teardown": "self.driver.quit()",
-                "wait": "WebDriverWait(self.driver, 10)"
-            },
-            "appium": {
-                "imports": [
-                    "from appium import webdriver",
-                    "from appium.webdriver.common.mobileby import MobileBy",
-                    "from selenium.webdriver.support.ui import WebDriverWait",
-                    "from selenium.webdriver.support import expected_conditions as EC",
-                    "import time",
-                    "import pytest"
-                ],
-                "setup": "self.driver = webdriver.Remote('http://localhost:4723/wd/hub', desired_caps)",
-                "teardown": "self.driver.quit()",
-                "wait": "WebDriverWait(self.driver, 10)"
-            },
-            "requests": {
-                "imports": [
-                    "import requests",
-                    "import json",
-                    "import pytest",
-                    "from typing import Dict, Any"
-                ],
-                "setup": "self.session = requests.Session()",
-                "teardown": "self.session.close()",
-                "wait": "time.sleep(1)"
-            },
-            # Java/Maven framework templates
-            "selenium-java": {
-                "imports": [
-                    "import org.openqa.selenium.WebDriver;",
-                    "import org.openqa.selenium.WebElement;",
-                    "import org.openqa.selenium.By;",
-                    "import org.openqa.selenium.chrome.ChromeDriver;",
-                    "import org.openqa.selenium.support.ui.WebDriverWait;",
-                    "import org.openqa.selenium.support.ui.ExpectedConditions;",
-                    "import org.openqa.selenium.support.PageFactory;",
-                    "import org.testng.annotations.*;",
-                    "import org.testng.Assert;",
-                    "import java.time.Duration;"
-                ],
-                "setup": "driver = new ChromeDriver();",
-                "teardown": "driver.quit();",
-                "wait": "new WebDriverWait(driver, Duration.ofSeconds(10))"
-            },
-            "appium-java": {
-                "imports": [
-                    "import io.appium.java_client.AppiumDriver;",
-                    "import io.appium.java_client.android.AndroidDriver;",
-                    "import io.appium.java_client.ios.IOSDriver;",
-                    "import org.openqa.selenium.remote.DesiredCapabilities;",
-                    "import org.testng.annotations.*;",
-                    "import org.testng.Assert;",
-                    "import java.net.URL;"
-                ],
-                "setup": "driver = new AndroidDriver(new URL(\"http://localhost:4723/wd/hub\"), capabilities);",
-                "teardown": "driver.quit();",
-                "wait": "new WebDriverWait(driver, Duration.ofSeconds(10))"
-            },
-            "rest-assured": {
-                "imports": [
-                    "import io.restassured.RestAssured;",
-                    "import io.restassured.response.Response;",
-                    "import io.restassured.specification.RequestSpecification;",
-                    "import org.testng.annotations.*;",
-                    "import org.testng.Assert;",
-                    "import static io.restassured.RestAssured.*;",
-                    "import static org.hamcrest.Matchers.*;"
-                ],
-                "setup": "RestAssured.baseURI = \"https://api.example.com\";",
-                "teardown": "// Cleanup if needed",
-                "wait": "// No wait needed for API tests"
-            },
-            # Modern Framework Templates
-            "webdriverio": {
-                "imports": [
-                    "import { browser, $, $$, expect } from '@wdio/globals'",
-                    "import { describe, it, before, after } from '@wdio/mocha-framework'",
-                    "import assert from 'assert'"
-                ],
-                "setup": "await browser.url('https://example.com')",
-                "teardown": "await browser.deleteSession()",
-                "wait": "await browser.waitUntil(async () => { return await $('selector').isDisplayed() }, { timeout: 10000 })"
-            },
-            "karate": {
-                "imports": [
-                    "import com.intuit.karate.junit5.Karate;",
-                    "import com.intuit.karate.KarateOptions;",
-                    "import org.junit.jupiter.api.Test;",
-                    "import static com.intuit.karate.junit5.Karate.run;"
-                ],
-                "setup": "// Karate setup is done in feature files",
-                "teardown": "// Karate teardown is automatic",
-                "wait": "// Karate has built-in wait mechanisms"
-            },
-            "playwright": {
-                "imports": [
-                    "import { test, expect } from '@playwright/test';",
-                    "import { chromium, firefox, webkit } from '@playwright/test';"
-                ],
-                "setup": "const browser = await chromium.launch(); const page = await browser.newPage();",
-                "teardown": "await browser.close();",
-                "wait": "await page.waitForSelector('selector', { timeout: 10000 });"
-            },
-            "cypress": {
-                "imports": [
-                    "/// <reference types=\"cypress\" />",
-                    "describe('Test Suite', () => {",
-                    "  beforeEach(() => {",
-                    "    cy.visit('https://example.com')",
-                    "  })"
-                ],
-                "setup": "cy.visit('https://example.com')",
-                "teardown": "// Cypress cleanup is automatic",
-                "wait": "cy.get('selector', { timeout: 10000 }).should('be.visible')"
-            }
-        }
-    
-    def generate_test_project(self, scenarios: List[Dict[str, Any]], project_name: str = "automation_project", project_type: str = "python", framework: str = "selenium") -> Dict[str, Any]:
-        """Excel senaryolarından tam otomasyon projesi oluştur"""
-        project_path = os.path.join(self.output_dir, project_name)
-        os.makedirs(project_path, exist_ok=True)
-        
-        # Proje yapısını oluştur
-        project_structure = {
-            "project_path": project_path,
-            "files_created": [],
-            "test_count": len(scenarios),
-            "framework": framework,
-            "project_type": project_type
-        }
-        
-        if project_type.lower() == "java":
-            self._create_maven_project(project_path, project_name, project_structure, scenarios)
-        elif project_type.lower() == "nodejs":
-            self._create_nodejs_project(project_path, project_name, project_structure, scenarios)
-        else:
-            self._create_python_project(project_path, project_structure, scenarios)
-        
-        return project_structure
-    
-    def _detect_framework(self, scenarios: List[Dict[str, Any]]) -> str:
-        """Test senaryolarından framework türünü tespit et"""
-        test_types = set(scenario.get('test_type', '').lower() for scenario in scenarios)
-        
-        if 'web' in test_types:
-            return 'selenium'
-        elif 'mobile' in test_types:
-            return 'appium'
-        elif 'api' in test_types:
-            return 'requests'
-        else:
-            return 'selenium'  # Varsayılan
-    
-    def _create_requirements_file(self, project_path: str, framework: str):
-        """requirements.txt dosyası oluştur"""
-        requirements = {
-            'selenium': [
-                'selenium==4.15.2',
-                'pytest==7.4.3',
-                'pytest-html==4.1.1',
-                'webdriver-manager==4.0.1',
-                'pytest-xdist==3.3.1'
-            ],
-            'appium': [
-                'Appium-Python-Client==3.1.1',
-                'pytest==7.4.3',
-                'pytest-html==4.1.1',
-                'pytest-xdist==3.3.1'
-            ],
-            'requests': [
-                'requests==2.31.0',
-                'pytest==7.4.3',
-                'pytest-html==4.1.1',
-                'pytest-xdist==3.3.1'
-            ]
-        }
-        
-        with open(os.path.join(project_path, "requirements.txt"), "w", encoding="utf-8") as f:
-            f.write("\n".join(requirements.get(framework, requirements['selenium'])))
-    
-    def _create_config_file(self, project_path: str, framework: str):
-        """Konfigürasyon dosyası oluştur"""
-        config_content = f'''# Otomasyon Projesi Konfigürasyonu
-# Framework: {framework.upper()}
+import jinja2
+
+# Locator eşlemeleri değişmez; method gövdesinde her çağrıda dict
+# kurmak yerine modül seviyesinde bir kez tanımlanır
+_SELENIUM_LOCATORS = MappingProxyType({
+    'id': 'By.ID',
+    'class': 'By.CLASS_NAME',
+    'xpath': 'By.XPATH',
+    'css': 'By.CSS_SELECTOR',
+    'name': 'By.NAME',
+    'link': 'By.LINK_TEXT'
+})
+
+_APPIUM_LOCATORS = MappingProxyType({
+    'id': 'MobileBy.ID',
+    'class': 'MobileBy.CLASS_NAME',
+    'xpath': 'MobileBy.XPATH',
+    'css': 'MobileBy.CSS_SELECTOR',
+    'name': 'MobileBy.NAME',
+    'link': 'MobileBy.LINK_TEXT'
+})
+
+_FRAMEWORK_LOCATORS = {
+    'selenium': _SELENIUM_LOCATORS,
+    'appium': _APPIUM_LOCATORS,
+}
+
+
+def _parse_steps(steps: List[Dict[str, Any]]) -> tuple:
+    """Adım sözlüklerini tek geçişte normalize edilmiş IR'a çevir
+
+    action/locator_type burada bir kez küçük harfe çevrilir; emitter'lar
+    ve memoizasyon anahtarı aynı demetleri paylaşır, adım sözlüğü
+    üzerinde ikinci bir geçiş yapılmaz.
+    """
+    return tuple(
+        (
+            step.get('action', '').lower(),
+            step.get('locator_type', '').lower(),
+            step.get('locator_value', ''),
+            step.get('test_data', ''),
+            step.get('expected_result', ''),
+        )
+        for step in steps
+    )
+
+# Framework şablonları değişmez veri: import sırasında bir kez kurulur,
+# tüm CodeGenerator instance'ları aynı donmuş kopyayı paylaşır
+_FRAMEWORK_TEMPLATES = MappingProxyType({
+    "selenium": {
+        "imports": (
+            "from selenium import webdriver",
+            "from selenium.webdriver.common.by import By",
+            "from selenium.webdriver.support.ui import WebDriverWait",
+            "from selenium.webdriver.support import expected_conditions as EC",
+            "from selenium.webdriver.common.keys import Keys",
+            "import time",
+            "import pytest"
+        ),
+        "setup": "self.driver = webdriver.Chrome()",
+        "teardown": "self.driver.quit()",
+        "wait": "WebDriverWait(self.driver, 10)"
+    },
+    "appium": {
+        "imports": (
+            "from appium import webdriver",
+            "from appium.webdriver.common.mobileby import MobileBy",
+            "from selenium.webdriver.support.ui import WebDriverWait",
+            "from selenium.webdriver.support import expected_conditions as EC",
+            "import time",
+            "import pytest"
+        ),
+        "setup": "self.driver = webdriver.Remote('http://localhost:4723/wd/hub', desired_caps)",
+        "teardown": "self.driver.quit()",
+        "wait": "WebDriverWait(self.driver, 10)"
+    },
+    "requests": {
+        "imports": (
+            "import requests",
+            "import json",
+            "import pytest",
+            "from typing import Dict, Any"
+        ),
+        "setup": "self.session = requests.Session()",
+        "teardown": "self.session.close()",
+        "wait": "time.sleep(1)"
+    },
+    # Java/Maven framework templates
+    "selenium-java": {
+        "imports": (
+            "import org.openqa.selenium.WebDriver;",
+            "import org.openqa.selenium.WebElement;",
+            "import org.openqa.selenium.By;",
+            "import org.openqa.selenium.chrome.ChromeDriver;",
+            "import org.openqa.selenium.support.ui.WebDriverWait;",
+            "import org.openqa.selenium.support.ui.ExpectedConditions;",
+            "import org.openqa.selenium.support.PageFactory;",
+            "import org.testng.annotations.*;",
+            "import org.testng.Assert;",
+            "import java.time.Duration;"
+        ),
+        "setup": "driver = new ChromeDriver();",
+        "teardown": "driver.quit();",
+        "wait": "new WebDriverWait(driver, Duration.ofSeconds(10))"
+    },
+    "appium-java": {
+        "imports": (
+            "import io.appium.java_client.AppiumDriver;",
+            "import io.appium.java_client.android.AndroidDriver;",
+            "import io.appium.java_client.ios.IOSDriver;",
+            "import org.openqa.selenium.remote.DesiredCapabilities;",
+            "import org.testng.annotations.*;",
+            "import org.testng.Assert;",
+            "import java.net.URL;"
+        ),
+        "setup": "driver = new AndroidDriver(new URL(\"http://localhost:4723/wd/hub\"), capabilities);",
+        "teardown": "driver.quit();",
+        "wait": "new WebDriverWait(driver, Duration.ofSeconds(10))"
+    },
+    "rest-assured": {
+        "imports": (
+            "import io.restassured.RestAssured;",
+            "import io.restassured.response.Response;",
+            "import io.restassured.specification.RequestSpecification;",
+            "import org.testng.annotations.*;",
+            "import org.testng.Assert;",
+            "import static io.restassured.RestAssured.*;",
+            "import static org.hamcrest.Matchers.*;"
+        ),
+        "setup": "RestAssured.baseURI = \"https://api.example.com\";",
+        "teardown": "// Cleanup if needed",
+        "wait": "// No wait needed for API tests"
+    },
+    # Modern Framework Templates
+    "webdriverio": {
+        "imports": (
+            "import { browser, $, $$, expect } from '@wdio/globals'",
+            "import { describe, it, before, after } from '@wdio/mocha-framework'",
+            "import assert from 'assert'"
+        ),
+        "setup": "await browser.url('https://example.com')",
+        "teardown": "await browser.deleteSession()",
+        "wait": "await browser.waitUntil(async () => { return await $('selector').isDisplayed() }, { timeout: 10000 })"
+    },
+    "karate": {
+        "imports": (
+            "import com.intuit.karate.junit5.Karate;",
+            "import com.intuit.karate.KarateOptions;",
+            "import org.junit.jupiter.api.Test;",
+            "import static com.intuit.karate.junit5.Karate.run;"
+        ),
+        "setup": "// Karate setup is done in feature files",
+        "teardown": "// Karate teardown is automatic",
+        "wait": "// Karate has built-in wait mechanisms"
+    },
+    "playwright": {
+        "imports": (
+            "import { test, expect } from '@playwright/test';",
+            "import { chromium, firefox, webkit } from '@playwright/test';"
+        ),
+        "setup": "const browser = await chromium.launch(); const page = await browser.newPage();",
+        "teardown": "await browser.close();",
+        "wait": "await page.waitForSelector('selector', { timeout: 10000 });"
+    },
+    "cypress": {
+        "imports": (
+            "/// <reference types=\"cypress\" />",
+            "describe('Test Suite', () => {",
+            "  beforeEach(() => {",
+            "    cy.visit('https://example.com')",
+            "  })"
+        ),
+        "setup": "cy.visit('https://example.com')",
+        "teardown": "// Cypress cleanup is automatic",
+        "wait": "cy.get('selector', { timeout: 10000 }).should('be.visible')"
+    }
+})
+
+# Import listeleri framework başına sabit; join şablon sözlüğünün
+# hemen yanında, import sırasında bir kez hesaplanır
+_IMPORTS_JOINED = {
+    fw: "\n".join(template["imports"])
+    for fw, template in _FRAMEWORK_TEMPLATES.items()
+}
+
+_JAVA_FRAMEWORK_MAP = {
+    "selenium": "selenium-java",
+    "appium": "appium-java",
+    "requests": "rest-assured"
+}
+
+
+@lru_cache(maxsize=256)
+def _java_ui_action_kind(action: str) -> str:
+    """UI aksiyonunu tür etiketine indirger; unique aksiyon başına bir tarama"""
+    if 'click' in action:
+        return 'click'
+    if 'input' in action or 'type' in action:
+        return 'input'
+    if 'verify' in action or 'assert' in action:
+        return 'verify'
+    return ''
+
+
+@lru_cache(maxsize=256)
+def _java_api_action_kind(action: str) -> str:
+    """API aksiyonunu tür etiketine indirger (rest-assured)"""
+    if 'get' in action:
+        return 'get'
+    if 'post' in action:
+        return 'post'
+    return ''
+
+
+# Java adım parçaları: (framework, aksiyon türü) başına tek çok satırlı
+# şablon; satır satır append yerine blok bir seferde biçimlenir
+_JAVA_STEP_TEMPLATES = {
+    ("selenium-java", "click"):
+        "            // Click on {element}\n"
+        "            WebElement {var} = driver.findElement(By.xpath(\"//*[contains(text(),'{element}')]\"));\n"
+        "            {var}.click();",
+    ("selenium-java", "input"):
+        "            // Input text: {value}\n"
+        "            WebElement inputField = driver.findElement(By.name(\"input\"));\n"
+        "            inputField.clear();\n"
+        "            inputField.sendKeys(\"{value}\");",
+    ("selenium-java", "verify"):
+        "            // Verify: {element}\n"
+        "            WebElement verifyElement = driver.findElement(By.xpath(\"//*[contains(text(),'{element}')]\"));\n"
+        "            Assert.assertTrue(verifyElement.isDisplayed(), \"Element {element} should be displayed\");",
+    ("appium-java", "click"):
+        "            // Click on {element}\n"
+        "            driver.findElement(By.xpath(\"//*[@text='{element}']\")).click();",
+    ("appium-java", "input"):
+        "            // Input text: {value}\n"
+        "            driver.findElement(By.className(\"android.widget.EditText\")).sendKeys(\"{value}\");",
+    ("appium-java", "verify"):
+        "            // Verify: {element}\n"
+        "            WebElement verifyElement = driver.findElement(By.xpath(\"//*[@text='{element}']\"));\n"
+        "            Assert.assertTrue(verifyElement.isDisplayed(), \"Element {element} should be displayed\");",
+    ("rest-assured", "get"):
+        "            // GET request\n"
+        "            Response response = given()\n"
+        "                .when()\n"
+        "                .get(\"/api/endpoint\")\n"
+        "                .then()\n"
+        "                .statusCode(200)\n"
+        "                .extract().response();",
+    ("rest-assured", "post"):
+        "            // POST request\n"
+        "            Response response = given()\n"
+        "                .contentType(\"application/json\")\n"
+        "                .body(\"{value}\")\n"
+        "                .when()\n"
+        "                .post(\"/api/endpoint\")\n"
+        "                .then()\n"
+        "                .statusCode(201)\n"
+        "                .extract().response();",
+}
+
+# Java test metodu iskeleti: baş/son bloklar framework başına sabit
+_JAVA_METHOD_HEADS = {
+    "selenium-java":
+        "    @Test\n"
+        "    public void testScenario() {\n"
+        "        try {\n"
+        "            // Test setup\n"
+        "            driver.manage().window().maximize();\n"
+        "            driver.manage().timeouts().implicitlyWait(Duration.ofSeconds(10));",
+    "appium-java":
+        "    @Test\n"
+        "    public void testScenario() {\n"
+        "        try {\n"
+        "            // Test setup",
+    "rest-assured":
+        "    @Test\n"
+        "    public void testScenario() {\n"
+        "        try {\n"
+        "            // Test setup",
+}
+
+_JAVA_METHOD_TAIL = (
+    "        } catch (Exception e) {\n"
+    "            Assert.fail(\"Test failed: \" + e.getMessage());\n"
+    "        }\n"
+    "    }"
+)
+
+
+# Sınıf adı temizliği: ASCII girdiler için C seviyesinde translate
+# tablosu (regex motoru hiç çalışmaz); Türkçe/Unicode karakter içeren
+# adlar derlenmiş regex'e düşer
+_CLASS_NAME_DELETE_TABLE = str.maketrans('', '', ''.join(
+    chr(c) for c in range(128) if not (chr(c).isalnum() or chr(c).isspace())
+))
+_CLASS_NAME_CLEAN_RE = re.compile(r'[^a-zA-Z0-9\s]')
+_JAVA_CLASS_NAME_CLEAN_RE = re.compile(r'[^a-zA-Z0-9]')
+
+# Proje dosyası şablonları: Jinja2 bunları import sırasında bir kez
+# bytecode'a derler; senaryo başına tokenize/parse/compile maliyeti
+# ödenmez, render() doğrudan çalışır
+_TEMPLATE_SOURCES = {
+    "config": '''# Otomasyon Projesi Konfigürasyonu
+# Framework: {{ framework.upper() }}
 
 import os
 from typing import Dict, Any
@@ -225,37 +329,37 @@ class Config:
     
     # Appium ayarları (Mobil için)
     APPIUM_SERVER = "http://localhost:4723/wd/hub"
-    ANDROID_CAPS = {{
+    ANDROID_CAPS = {
         "platformName": "Android",
         "platformVersion": "11.0",
         "deviceName": "Android Emulator",
         "automationName": "UiAutomator2",
         "app": "path/to/your/app.apk"
-    }}
+    }
     
-    IOS_CAPS = {{
+    IOS_CAPS = {
         "platformName": "iOS",
         "platformVersion": "15.0",
         "deviceName": "iPhone Simulator",
         "automationName": "XCUITest",
         "app": "path/to/your/app.app"
-    }}
+    }
     
     # API ayarları
     BASE_URL = "https://api.example.com"
     API_TIMEOUT = 30
     
     # Test verileri
-    TEST_DATA = {{
-        "valid_user": {{
+    TEST_DATA = {
+        "valid_user": {
             "email": "test@example.com",
             "password": "123456"
-        }},
-        "invalid_user": {{
+        },
+        "invalid_user": {
             "email": "invalid@example.com",
             "password": "wrong"
-        }}
-    }}
+        }
+    }
     
     # Rapor ayarları
     REPORT_DIR = "reports"
@@ -266,16 +370,9 @@ class Config:
         """Driver capabilities döndür"""
         if framework == "appium":
             return cls.ANDROID_CAPS
-        return {{}}
-'''
-        
-        with open(os.path.join(project_path, "config.py"), "w", encoding="utf-8") as f:
-            f.write(config_content)
-    
-    def _create_setup_script(self, project_path: str, framework: str):
-        """Otomatik kurulum scripti oluştur"""
-        if os.name == 'nt':  # Windows
-            setup_content = f'''@echo off
+        return {}
+''',
+    "setup_windows": '''@echo off
 echo ========================================
 echo AI Test Tool - Otomatik Kurulum
 echo ========================================
@@ -315,10 +412,8 @@ echo 1. venv\\Scripts\\activate.bat
 echo 2. python run_tests.py
 echo.
 pause
-'''
-            setup_file = "setup.bat"
-        else:  # Unix/Linux/Mac
-            setup_content = f'''#!/bin/bash
+''',
+    "setup_unix": '''#!/bin/bash
 
 echo "========================================"
 echo "AI Test Tool - Otomatik Kurulum"
@@ -356,194 +451,35 @@ echo "Testleri çalıştırmak için:"
 echo "1. source venv/bin/activate"
 echo "2. python run_tests.py"
 echo
-'''
-            setup_file = "setup.sh"
-        
-        with open(os.path.join(project_path, setup_file), "w", encoding="utf-8") as f:
-            f.write(setup_content)
-        
-        # Make executable (Unix/Linux/Mac only)
-        if os.name != 'nt':  # Not Windows
-            os.chmod(os.path.join(project_path, setup_file), 0o755)
-        
-        return setup_file
-    
-    def _generate_test_file(self, project_path: str, scenario: Dict[str, Any], framework: str) -> str:
-        """Tek bir test senaryosu için test dosyası oluştur"""
-        test_id = scenario.get('test_id', 'test')
-        test_name = scenario.get('test_name', 'Test')
-        
-        # Test sınıf adını oluştur
-        class_name = self._generate_class_name(test_name)
-        
-        # Test metodunu oluştur
-        test_method = self._generate_test_method(scenario, framework)
-        
-        # Tam test dosyası içeriğini oluştur
-        test_content = self._generate_test_file_content(class_name, test_method, framework)
-        
-        # Dosyayı kaydet
-        filename = f"test_{test_id.lower()}.py"
-        filepath = os.path.join(project_path, filename)
-        
-        with open(filepath, "w", encoding="utf-8") as f:
-            f.write(test_content)
-        
-        return filename
-    
-    def _generate_class_name(self, test_name: str) -> str:
-        """Test adından sınıf adı oluştur"""
-        # Özel karakterleri temizle ve camelCase yap
-        clean_name = re.sub(r'[^a-zA-Z0-9\s]', '', test_name)
-        words = clean_name.split()
-        class_name = ''.join(word.capitalize() for word in words)
-        return f"Test{class_name}"
-    
-    def _generate_test_method(self, scenario: Dict[str, Any], framework: str) -> str:
-        """Test metodunu oluştur"""
-        test_id = scenario.get('test_id', 'test')
-        test_method = []
-        test_method.append(f"    def test_{test_id.lower()}(self):")
-        test_method.append(f'        """{scenario.get("test_description", "Test açıklaması")}"""')
-        test_method.append("        try:")
-        
-        # Test adımlarını işle
-        for step in scenario.get('steps', []):
-            step_code = self._generate_step_code(step, framework)
-            test_method.extend([f"            {line}" for line in step_code])
-        
-        # Assertion ekle
-        test_method.append("            # Test başarılı")
-        test_method.append("            assert True")
-        test_method.append("        except Exception as e:")
-        test_method.append("            # Hata durumunda ekran görüntüsü al")
-        if framework == 'selenium':
-            test_method.append(f"            self.driver.save_screenshot(f'screenshots/error_{test_id}.png')")
-        test_method.append("            raise e")
-        
-        return "\n".join(test_method)
-    
-    def _generate_step_code(self, step: Dict[str, Any], framework: str) -> List[str]:
-        """Tek bir test adımı için kod oluştur"""
-        action = step.get('action', '').lower()
-        locator_type = step.get('locator_type', '').lower()
-        locator_value = step.get('locator_value', '')
-        test_data = step.get('test_data', '')
-        
-        code_lines = []
-        
-        if action == 'aç':
-            if framework == 'selenium':
-                code_lines.append(f"self.driver.get('{test_data}')")
-            elif framework == 'appium':
-                code_lines.append(f"# Uygulama zaten açık")
-            elif framework == 'requests':
-                code_lines.append(f"response = self.session.get('{test_data}')")
-                code_lines.append("assert response.status_code == 200")
-        
-        elif action == 'tıkla':
-            if locator_value:
-                element_code = self._get_element_code(locator_type, locator_value, framework)
-                code_lines.append(f"element = {element_code}")
-                code_lines.append("element.click()")
-        
-        elif action == 'yaz':
-            if locator_value and test_data:
-                element_code = self._get_element_code(locator_type, locator_value, framework)
-                code_lines.append(f"element = {element_code}")
-                code_lines.append(f"element.clear()")
-                code_lines.append(f"element.send_keys('{test_data}')")
-        
-        elif action == 'bekle':
-            if framework == 'selenium':
-                code_lines.append("time.sleep(2)")
-            elif framework == 'appium':
-                code_lines.append("time.sleep(2)")
-            elif framework == 'requests':
-                code_lines.append("time.sleep(1)")
-        
-        elif action == 'seç':
-            if locator_value and test_data:
-                element_code = self._get_element_code(locator_type, locator_value, framework)
-                code_lines.append(f"element = {element_code}")
-                code_lines.append(f"element.click()")
-                # Dropdown seçimi için ek kod eklenebilir
-        
-        # Beklenen sonuç kontrolü
-        expected_result = step.get('expected_result', '')
-        if expected_result:
-            code_lines.append(f"# Beklenen sonuç: {expected_result}")
-        
-        return code_lines
-    
-    def _get_element_code(self, locator_type: str, locator_value: str, framework: str) -> str:
-        """Element bulma kodu oluştur"""
-        if framework == 'selenium':
-            locator_map = {
-                'id': 'By.ID',
-                'class': 'By.CLASS_NAME',
-                'xpath': 'By.XPATH',
-                'css': 'By.CSS_SELECTOR',
-                'name': 'By.NAME',
-                'link': 'By.LINK_TEXT'
-            }
-            by_type = locator_map.get(locator_type, 'By.ID')
-            return f"self.wait.until(EC.element_to_be_clickable(({by_type}, '{locator_value}')))"
-        
-        elif framework == 'appium':
-            locator_map = {
-                'id': 'MobileBy.ID',
-                'class': 'MobileBy.CLASS_NAME',
-                'xpath': 'MobileBy.XPATH',
-                'css': 'MobileBy.CSS_SELECTOR',
-                'name': 'MobileBy.NAME',
-                'link': 'MobileBy.LINK_TEXT'
-            }
-            by_type = locator_map.get(locator_type, 'MobileBy.ID')
-            return f"self.wait.until(EC.element_to_be_clickable(({by_type}, '{locator_value}')))"
-        
-        else:
-            return f"# Element bulma kodu: {locator_type} = '{locator_value}'"
-    
-    def _generate_test_file_content(self, class_name: str, test_method: str, framework: str) -> str:
-        """Tam test dosyası içeriğini oluştur"""
-        imports = self.framework_templates[framework]["imports"]
-        setup = self.framework_templates[framework]["setup"]
-        teardown = self.framework_templates[framework]["teardown"]
-        wait = self.framework_templates[framework]["wait"]
-        
-        content = f'''{chr(10).join(imports)}
+''',
+    "test_file": '''{{ imports }}
 
 from config import Config
 
 
-class {class_name}:
-    """{class_name} test sınıfı"""
+class {{ class_name }}:
+    """{{ class_name }} test sınıfı"""
     
     def setup_method(self):
         """Her test öncesi çalışır"""
-        {setup}
-        self.wait = {wait}
+        {{ setup }}
+        self.wait = {{ wait }}
     
     def teardown_method(self):
         """Her test sonrası çalışır"""
-        {teardown}
-    
-{test_method}
-'''
-        return content
+        {{ teardown }}
     
-    def _create_readme_file(self, project_path: str, project_structure: Dict[str, Any]):
-        """README.md dosyası oluştur"""
-        readme_content = f'''# Otomasyon Projesi
+{{ test_method }}
+''',
+    "readme": '''# Otomasyon Projesi
 
 Bu proje, AI Test Tool tarafından otomatik olarak oluşturulmuştur.
 
 ## Proje Bilgileri
 
-- **Framework**: {project_structure["framework"].upper()}
-- **Test Sayısı**: {project_structure["test_count"]}
-- **Oluşturulma Tarihi**: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
+- **Framework**: {{ framework.upper() }}
+- **Test Sayısı**: {{ test_count }}
+- **Oluşturulma Tarihi**: {{ created_at }}
 
 ## Kurulum
 
@@ -573,7 +509,7 @@ pytest --html=reports/report.html
 ## Proje Yapısı
 
 ```
-{project_structure["project_path"]}/
+{{ project_path }}/
 ├── requirements.txt      # Gerekli paketler
 ├── config.py            # Konfigürasyon dosyası
 ├── test_*.py           # Test dosyaları
@@ -588,28 +524,22 @@ pytest --html=reports/report.html
 - Tarayıcı türü (Selenium için)
 - Bekleme süreleri
 - Test verileri
-- API endpoint'leri
+- API endpoint\'leri
 
 ## Notlar
 
 - Test çalıştırmadan önce `config.py` dosyasındaki ayarları kontrol edin
-- Mobil testler için Appium Server'ın çalışır durumda olduğundan emin olun
-- API testleri için doğru endpoint URL'lerini ayarlayın
+- Mobil testler için Appium Server\'ın çalışır durumda olduğundan emin olun
+- API testleri için doğru endpoint URL\'lerini ayarlayın
 
 ## Destek
 
-Sorunlar için AI Test Tool'u kullanabilirsiniz.
-'''
-        
-        with open(os.path.join(project_path, "README.md"), "w", encoding="utf-8") as f:
-            f.write(readme_content)
-    
-    def _create_test_runner(self, project_path: str, framework: str) -> str:
-        """Test runner script'i oluştur"""
-        runner_content = f'''#!/usr/bin/env python3
+Sorunlar için AI Test Tool\'u kullanabilirsiniz.
+''',
+    "runner": '''#!/usr/bin/env python3
 """
 Test Runner Script
-Framework: {framework.upper()}
+Framework: {{ framework.upper() }}
 """
 
 import pytest
@@ -631,7 +561,7 @@ def main():
     # Test argümanları
     args = [
         "--verbose",
-        f"--html={{report_dir}}/report_{{datetime.now().strftime('%Y%m%d_%H%M%S')}}.html",
+        f"--html={report_dir}/report_{datetime.now().strftime(\'%Y%m%d_%H%M%S\')}.html",
         "--self-contained-html",
         "--tb=short"
     ]
@@ -642,63 +572,126 @@ def main():
     # Testleri çalıştır
     exit_code = pytest.main(args)
     
-    print(f"\\nTest çalıştırma tamamlandı. Çıkış kodu: {{exit_code}}")
+    print(f"\\nTest çalıştırma tamamlandı. Çıkış kodu: {exit_code}")
     return exit_code
 
 if __name__ == "__main__":
     sys.exit(main())
-'''
-        
-        runner_path = os.path.join(project_path, "run_tests.py")
-        with open(runner_path, "w", encoding="utf-8") as f:
-            f.write(runner_content)
-        
-        # Çalıştırılabilir yap
-        os.chmod(runner_path, 0o755)
-        
-        return "run_tests.py"
+''',
+    "testng": '''<?xml version="1.0" encoding="UTF-8"?>
+<!DOCTYPE suite SYSTEM "https://testng.org/testng-1.0.dtd">
+<suite name="TestMate Suite" parallel="methods" thread-count="2">
+    <test name="TestMate Tests">
+        <classes>
+            <class name="{{ package_name }}.*"/>
+        </classes>
+    </test>
+</suite>''',
+    "java_config": '''# TestMate Studio Configuration
+# Framework: {{ framework }}
 
-    def _create_maven_project(self, project_path: str, project_name: str, project_structure: Dict[str, Any], scenarios: List[Dict[str, Any]]):
-        """Maven projesi oluştur"""
-        # Maven dizin yapısını oluştur
-        src_main_java = os.path.join(project_path, "src", "main", "java")
-        src_test_java = os.path.join(project_path, "src", "test", "java")
-        src_main_resources = os.path.join(project_path, "src", "main", "resources")
-        src_test_resources = os.path.join(project_path, "src", "test", "resources")
-        
-        os.makedirs(src_main_java, exist_ok=True)
-        os.makedirs(src_test_java, exist_ok=True)
-        os.makedirs(src_main_resources, exist_ok=True)
-        os.makedirs(src_test_resources, exist_ok=True)
-        
-        # pom.xml oluştur
-        self._create_pom_xml(project_path, project_name, project_structure["framework"])
-        project_structure["files_created"].append("pom.xml")
-        
-        # Test dosyalarını oluştur
-        package_name = f"com.testmate.{project_name.lower().replace('-', '').replace('_', '')}"
-        test_package_path = os.path.join(src_test_java, *package_name.split('.'))
-        os.makedirs(test_package_path, exist_ok=True)
-        
-        for scenario in scenarios:
-            test_file = self._generate_java_test_file(test_package_path, scenario, project_structure["framework"], package_name)
-            project_structure["files_created"].append(test_file)
-        
-        # TestNG XML oluştur
-        self._create_testng_xml(project_path, package_name)
-        project_structure["files_created"].append("testng.xml")
-        
-        # README dosyası oluştur
-        self._create_java_readme_file(project_path, project_structure)
-        project_structure["files_created"].append("README.md")
-        
-        # Config dosyası oluştur
-        self._create_java_config_file(src_test_resources, project_structure["framework"])
-        project_structure["files_created"].append("src/test/resources/config.properties")
-    
-    def _create_pom_xml(self, project_path: str, project_name: str, framework: str):
-        """Maven pom.xml dosyası oluştur"""
-        pom_content = f'''<?xml version="1.0" encoding="UTF-8"?>
+# Browser Configuration
+browser=chrome
+headless=false
+implicit.wait=10
+explicit.wait=10
+page.load.timeout=30
+
+# Appium Configuration
+appium.server=http://localhost:4723/wd/hub
+android.platform=Android
+android.version=11.0
+android.device=Android Emulator
+android.automation=UiAutomator2
+
+# API Configuration
+api.base.url=https://api.example.com
+api.timeout=30
+
+# Test Data
+test.data.valid.email=test@example.com
+test.data.valid.password=123456
+test.data.invalid.email=invalid@example.com
+test.data.invalid.password=wrong
+
+# Report Configuration
+report.dir=target/reports
+screenshot.dir=target/screenshots''',
+    "java_readme": '''# {{ project_name }}
+
+Bu proje TestMate Studio tarafından otomatik olarak oluşturulmuştur.
+
+## Proje Bilgileri
+
+- **Framework**: {{ framework }}
+- **Proje Türü**: Java/Maven
+- **Test Sayısı**: {{ test_count }}
+- **Oluşturulan Dosyalar**: {{ files_created }}
+
+## Gereksinimler
+
+- Java 11 veya üzeri
+- Maven 3.6 veya üzeri
+- Chrome WebDriver (Selenium için)
+- Appium Server (Mobil testler için)
+
+## Kurulum
+
+1. Projeyi klonlayın veya indirin
+2. Maven dependencies'leri yükleyin:
+   ```bash
+   mvn clean install
+   ```
+
+## Testleri Çalıştırma
+
+### Tüm Testleri Çalıştırma
+```bash
+mvn test
+```
+
+### TestNG XML ile Çalıştırma
+```bash
+mvn test -DsuiteXmlFile=testng.xml
+```
+
+### Belirli Test Sınıfını Çalıştırma
+```bash
+mvn test -Dtest=TestClassName
+```
+
+## Proje Yapısı
+
+```
+src/
+├── main/
+│   ├── java/          # Ana Java kaynak kodları
+│   └── resources/     # Kaynak dosyaları
+└── test/
+    ├── java/          # Test Java kaynak kodları
+    └── resources/     # Test kaynak dosyaları
+        └── config.properties  # Test konfigürasyonu
+```
+
+## Konfigürasyon
+
+Test ayarlarını `src/test/resources/config.properties` dosyasından düzenleyebilirsiniz.
+
+## Raporlar
+
+Test raporları `target/reports` klasöründe oluşturulur.
+
+## Destek
+
+TestMate Studio ile oluşturulan bu proje için destek almak için:
+- Dokümantasyonu inceleyin
+- TestMate Studio'yu kullanın
+- Gerekirse ek test senaryoları ekleyin
+
+---
+*TestMate Studio tarafından oluşturuldu - {{ created_at }}*
+''',
+    "pom": '''<?xml version="1.0" encoding="UTF-8"?>
 <project xmlns="http://maven.apache.org/POM/4.0.0"
          xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance"
          xsi:schemaLocation="http://maven.apache.org/POM/4.0.0 
@@ -706,11 +699,11 @@ if __name__ == "__main__":
     <modelVersion>4.0.0</modelVersion>
 
     <groupId>com.testmate</groupId>
-    <artifactId>{project_name.lower().replace(' ', '-')}</artifactId>
+    <artifactId>{{ artifact_id }}</artifactId>
     <version>1.0.0</version>
     <packaging>jar</packaging>
 
-    <name>{project_name}</name>
+    <name>{{ project_name }}</name>
     <description>TestMate Studio Generated Test Project</description>
 
     <properties>
@@ -729,7 +722,7 @@ if __name__ == "__main__":
         <dependency>
             <groupId>org.testng</groupId>
             <artifactId>testng</artifactId>
-            <version>${{testng.version}}</version>
+            <version>${testng.version}</version>
             <scope>test</scope>
         </dependency>
 
@@ -737,28 +730,24 @@ if __name__ == "__main__":
         <dependency>
             <groupId>org.seleniumhq.selenium</groupId>
             <artifactId>selenium-java</artifactId>
-            <version>${{selenium.version}}</version>
+            <version>${selenium.version}</version>
         </dependency>
 
         <!-- WebDriverManager -->
         <dependency>
             <groupId>io.github.bonigarcia</groupId>
             <artifactId>webdrivermanager</artifactId>
-            <version>${{webdrivermanager.version}}</version>
-        </dependency>'''
-
-        # Framework-specific dependencies
-        if framework == "appium-java":
-            pom_content += '''
+            <version>${webdrivermanager.version}</version>
+        </dependency>
+{% if framework == "appium-java" %}
 
         <!-- Appium Java Client -->
         <dependency>
             <groupId>io.appium</groupId>
             <artifactId>java-client</artifactId>
             <version>${appium.version}</version>
-        </dependency>'''
-        elif framework == "rest-assured":
-            pom_content += '''
+        </dependency>
+{% elif framework == "rest-assured" %}
 
         <!-- REST Assured -->
         <dependency>
@@ -782,9 +771,8 @@ if __name__ == "__main__":
             <artifactId>xml-path</artifactId>
             <version>${restassured.version}</version>
             <scope>test</scope>
-        </dependency>'''
-        elif framework == "karate":
-            pom_content += '''
+        </dependency>
+{% elif framework == "karate" %}
 
         <!-- Karate Framework -->
         <dependency>
@@ -800,9 +788,8 @@ if __name__ == "__main__":
             <artifactId>karate-netty</artifactId>
             <version>1.4.1</version>
             <scope>test</scope>
-        </dependency>'''
-
-        pom_content += '''
+        </dependency>
+{% endif %}
 
         <!-- Logging -->
         <dependency>
@@ -861,260 +848,99 @@ if __name__ == "__main__":
             </plugin>
         </plugins>
     </build>
-</project>'''
-
-        with open(os.path.join(project_path, "pom.xml"), "w", encoding="utf-8") as f:
-            f.write(pom_content)
-    
-    def _create_testng_xml(self, project_path: str, package_name: str):
-        """TestNG XML dosyası oluştur"""
-        testng_content = f'''<?xml version="1.0" encoding="UTF-8"?>
-<!DOCTYPE suite SYSTEM "https://testng.org/testng-1.0.dtd">
-<suite name="TestMate Suite" parallel="methods" thread-count="2">
-    <test name="TestMate Tests">
-        <classes>
-            <class name="{package_name}.*"/>
-        </classes>
-    </test>
-</suite>'''
-
-        with open(os.path.join(project_path, "testng.xml"), "w", encoding="utf-8") as f:
-            f.write(testng_content)
-    
-    def _create_java_config_file(self, resources_path: str, framework: str):
-        """Java konfigürasyon dosyası oluştur"""
-        config_content = f'''# TestMate Studio Configuration
-# Framework: {framework}
-
-# Browser Configuration
-browser=chrome
-headless=false
-implicit.wait=10
-explicit.wait=10
-page.load.timeout=30
-
-# Appium Configuration
-appium.server=http://localhost:4723/wd/hub
-android.platform=Android
-android.version=11.0
-android.device=Android Emulator
-android.automation=UiAutomator2
-
-# API Configuration
-api.base.url=https://api.example.com
-api.timeout=30
-
-# Test Data
-test.data.valid.email=test@example.com
-test.data.valid.password=123456
-test.data.invalid.email=invalid@example.com
-test.data.invalid.password=wrong
-
-# Report Configuration
-report.dir=target/reports
-screenshot.dir=target/screenshots'''
-
-        with open(os.path.join(resources_path, "config.properties"), "w", encoding="utf-8") as f:
-            f.write(config_content)
-    
-    def _generate_java_test_file(self, test_package_path: str, scenario: Dict[str, Any], framework: str, package_name: str) -> str:
-        """Java test dosyası oluştur"""
-        test_name = scenario.get('test_name', 'TestScenario')
-        class_name = self._generate_java_class_name(test_name)
-        
-        # Framework'a göre Java framework'ünü belirle
-        java_framework = self._get_java_framework(framework)
-        
-        # Test metodunu oluştur
-        test_method = self._generate_java_test_method(scenario, java_framework)
-        
-        # Test dosyası içeriğini oluştur
-        test_content = self._generate_java_test_file_content(class_name, test_method, java_framework, package_name)
-        
-        # Dosyayı kaydet
-        file_path = os.path.join(test_package_path, f"{class_name}.java")
-        with open(file_path, "w", encoding="utf-8") as f:
-            f.write(test_content)
-        
-        return f"src/test/java/{package_name.replace('.', '/')}/{class_name}.java"
-    
-    def _get_java_framework(self, framework: str) -> str:
-        """Framework'ü Java karşılığına çevir"""
-        framework_map = {
-            "selenium": "selenium-java",
-            "appium": "appium-java",
-            "requests": "rest-assured"
-        }
-        return framework_map.get(framework, "selenium-java")
-    
-    def _generate_java_class_name(self, test_name: str) -> str:
-        """Java sınıf adı oluştur"""
-        # Test adından geçerli Java sınıf adı oluştur
-        class_name = re.sub(r'[^a-zA-Z0-9]', '', test_name)
-        if not class_name[0].isalpha():
-            class_name = "Test" + class_name
-        return class_name + "Test"
-    
-    def _generate_java_test_method(self, scenario: Dict[str, Any], framework: str) -> str:
-        """Java test metodu oluştur"""
-        test_steps = scenario.get('steps', [])
-        method_content = []
-        
-        if framework == "selenium-java":
-            method_content.extend([
-                "    @Test",
-                "    public void testScenario() {",
-                "        try {",
-                "            // Test setup",
-                "            driver.manage().window().maximize();",
-                "            driver.manage().timeouts().implicitlyWait(Duration.ofSeconds(10));"
-            ])
-            
-            for step in test_steps:
-                step_code = self._generate_java_step_code(step, framework)
-                method_content.extend(step_code)
-            
-            method_content.extend([
-                "        } catch (Exception e) {",
-                "            Assert.fail(\"Test failed: \" + e.getMessage());",
-                "        }",
-                "    }"
-            ])
-        
-        elif framework == "appium-java":
-            method_content.extend([
-                "    @Test",
-                "    public void testScenario() {",
-                "        try {",
-                "            // Test setup"
-            ])
-            
-            for step in test_steps:
-                step_code = self._generate_java_step_code(step, framework)
-                method_content.extend(step_code)
-            
-            method_content.extend([
-                "        } catch (Exception e) {",
-                "            Assert.fail(\"Test failed: \" + e.getMessage());",
-                "        }",
-                "    }"
-            ])
-        
-        elif framework == "rest-assured":
-            method_content.extend([
-                "    @Test",
-                "    public void testScenario() {",
-                "        try {",
-                "            // Test setup"
-            ])
-            
-            for step in test_steps:
-                step_code = self._generate_java_step_code(step, framework)
-                method_content.extend(step_code)
-            
-            method_content.extend([
-                "        } catch (Exception e) {",
-                "            Assert.fail(\"Test failed: \" + e.getMessage());",
-                "        }",
-                "    }"
-            ])
-        
-        return "\n".join(method_content)
-    
-    def _generate_java_step_code(self, step: Dict[str, Any], framework: str) -> List[str]:
-        """Java adım kodu oluştur"""
-        action = step.get('action', '').lower()
-        element = step.get('element', '')
-        value = step.get('value', '')
-        
-        code_lines = []
-        
-        if framework == "selenium-java":
-            if 'click' in action:
-                code_lines.append(f"            // Click on {element}")
-                code_lines.append(f"            WebElement {element.lower().replace(' ', '_')} = driver.findElement(By.xpath(\"//*[contains(text(),'{element}')]\"));")
-                code_lines.append(f"            {element.lower().replace(' ', '_')}.click();")
-            elif 'input' in action or 'type' in action:
-                code_lines.append(f"            // Input text: {value}")
-                code_lines.append(f"            WebElement inputField = driver.findElement(By.name(\"input\"));")
-                code_lines.append(f"            inputField.clear();")
-                code_lines.append(f"            inputField.sendKeys(\"{value}\");")
-            elif 'verify' in action or 'assert' in action:
-                code_lines.append(f"            // Verify: {element}")
-                code_lines.append(f"            WebElement verifyElement = driver.findElement(By.xpath(\"//*[contains(text(),'{element}')]\"));")
-                code_lines.append(f"            Assert.assertTrue(verifyElement.isDisplayed(), \"Element {element} should be displayed\");")
-        
-        elif framework == "appium-java":
-            if 'click' in action:
-                code_lines.append(f"            // Click on {element}")
-                code_lines.append(f"            driver.findElement(By.xpath(\"//*[@text='{element}']\")).click();")
-            elif 'input' in action or 'type' in action:
-                code_lines.append(f"            // Input text: {value}")
-                code_lines.append(f"            driver.findElement(By.className(\"android.widget.EditText\")).sendKeys(\"{value}\");")
-            elif 'verify' in action or 'assert' in action:
-                code_lines.append(f"            // Verify: {element}")
-                code_lines.append(f"            WebElement verifyElement = driver.findElement(By.xpath(\"//*[@text='{element}']\"));")
-                code_lines.append(f"            Assert.assertTrue(verifyElement.isDisplayed(), \"Element {element} should be displayed\");")
-        
-        elif framework == "rest-assured":
-            if 'get' in action:
-                code_lines.append(f"            // GET request")
-                code_lines.append(f"            Response response = given()")
-                code_lines.append(f"                .when()")
-                code_lines.append(f"                .get(\"/api/endpoint\")")
-                code_lines.append(f"                .then()")
-                code_lines.append(f"                .statusCode(200)")
-                code_lines.append(f"                .extract().response();")
-            elif 'post' in action:
-                code_lines.append(f"            // POST request")
-                code_lines.append(f"            Response response = given()")
-                code_lines.append(f"                .contentType(\"application/json\")")
-                code_lines.append(f"                .body(\"{value}\")")
-                code_lines.append(f"                .when()")
-                code_lines.append(f"                .post(\"/api/endpoint\")")
-                code_lines.append(f"                .then()")
-                code_lines.append(f"                .statusCode(201)")
-                code_lines.append(f"                .extract().response();")
-        
-        return code_lines
-    
-    def _generate_java_test_file_content(self, class_name: str, test_method: str, framework: str, package_name: str) -> str:
-        """Java test dosyası içeriği oluştur"""
-        template = self.framework_templates.get(framework, self.framework_templates["selenium-java"])
-        
-        imports = "\n".join(template["imports"])
-        setup = template["setup"]
-        teardown = template["teardown"]
-        
-        if framework == "selenium-java":
-            content = f'''package {package_name};
-
-{imports}
+</project>''',
+}
+
+# Environment modül seviyesinde: tüm CodeGenerator instance'ları aynı
+# derlenmiş şablonları paylaşır
+_JINJA_ENV = jinja2.Environment(
+    loader=jinja2.DictLoader(_TEMPLATE_SOURCES),
+    trim_blocks=True,
+    lstrip_blocks=True,
+    auto_reload=False,
+    cache_size=-1,
+    keep_trailing_newline=True,
+)
 
-public class {class_name} {{
+_TEMPLATES = {name: _JINJA_ENV.get_template(name) for name in _TEMPLATE_SOURCES}
+
+# Framework'e göre tamamen statik içerikler bir kez render edilip UTF-8
+# olarak encode edilir; proje başına codec'ten tekrar geçmezler
+_REQUIREMENTS = {
+    'selenium': (
+        'selenium==4.15.2',
+        'pytest==7.4.3',
+        'pytest-html==4.1.1',
+        'webdriver-manager==4.0.1',
+        'pytest-xdist==3.3.1'
+    ),
+    'appium': (
+        'Appium-Python-Client==3.1.1',
+        'pytest==7.4.3',
+        'pytest-html==4.1.1',
+        'pytest-xdist==3.3.1'
+    ),
+    'requests': (
+        'requests==2.31.0',
+        'pytest==7.4.3',
+        'pytest-html==4.1.1',
+        'pytest-xdist==3.3.1'
+    )
+}
+_REQUIREMENTS_BYTES = {
+    fw: "\n".join(reqs).encode("utf-8") for fw, reqs in _REQUIREMENTS.items()
+}
+_SETUP_SCRIPT_BYTES = {
+    "windows": _TEMPLATES["setup_windows"].render().encode("utf-8"),
+    "unix": _TEMPLATES["setup_unix"].render().encode("utf-8"),
+}
+
+
+@lru_cache(maxsize=None)
+def _config_bytes(framework: str) -> bytes:
+    return _TEMPLATES["config"].render(framework=framework).encode("utf-8")
+
+
+@lru_cache(maxsize=None)
+def _runner_bytes(framework: str) -> bytes:
+    return _TEMPLATES["runner"].render(framework=framework).encode("utf-8")
+
+# Test dosyası iskeleti kurulurken değişken yerlerini işaretleyen
+# sentinel'lar; \x00 üretilen içerikte geçemez
+_SKEL_CLASS = "\x00CLASS_NAME\x00"
+_SKEL_METHOD = "\x00TEST_METHOD\x00"
+_SKEL_PACKAGE = "\x00PACKAGE_NAME\x00"
+
+# Java test dosyası gövdeleri: framework sabitleri (imports, setup,
+# teardown, wait) import sırasında bir kez gömülür; senaryo başına
+# yalnızca paket, sınıf adı ve test metodu yerine konur
+_JAVA_FILE_BODIES = {
+    "selenium-java": f'''package {_SKEL_PACKAGE};
+
+\x00IMPORTS\x00
+
+public class {_SKEL_CLASS} {{
     private WebDriver driver;
     private WebDriverWait wait;
 
     @BeforeMethod
     public void setUp() {{
-        {setup}
-        wait = {template["wait"]};
+        \x00SETUP\x00
+        wait = \x00WAIT\x00;
     }}
 
     @AfterMethod
     public void tearDown() {{
-        {teardown}
+        \x00TEARDOWN\x00
     }}
 
-{test_method}
-}}'''
-        
-        elif framework == "appium-java":
-            content = f'''package {package_name};
+{_SKEL_METHOD}
+}}''',
+    "appium-java": f'''package {_SKEL_PACKAGE};
 
-{imports}
+\x00IMPORTS\x00
 
-public class {class_name} {{
+public class {_SKEL_CLASS} {{
     private AppiumDriver driver;
     private WebDriverWait wait;
 
@@ -1126,143 +952,632 @@ public class {class_name} {{
         capabilities.setCapability("deviceName", "Android Emulator");
         capabilities.setCapability("automationName", "UiAutomator2");
         
-        {setup}
-        wait = {template["wait"]};
+        \x00SETUP\x00
+        wait = \x00WAIT\x00;
     }}
 
     @AfterMethod
     public void tearDown() {{
-        {teardown}
+        \x00TEARDOWN\x00
     }}
 
-{test_method}
-}}'''
-        
-        elif framework == "rest-assured":
-            content = f'''package {package_name};
+{_SKEL_METHOD}
+}}''',
+    "rest-assured": f'''package {_SKEL_PACKAGE};
 
-{imports}
+\x00IMPORTS\x00
 
-public class {class_name} {{
+public class {_SKEL_CLASS} {{
     
     @BeforeMethod
     public void setUp() {{
-        {setup}
+        \x00SETUP\x00
     }}
 
     @AfterMethod
     public void tearDown() {{
-        {teardown}
+        \x00TEARDOWN\x00
     }}
 
-{test_method}
-}}'''
+{_SKEL_METHOD}
+}}''',
+}
+
+
+def _build_java_skeletons():
+    """Java dosya iskeletlerini bir kez kur (head, mid1, mid2, tail)"""
+    skeletons = {}
+    for fw, body in _JAVA_FILE_BODIES.items():
+        template = _FRAMEWORK_TEMPLATES[fw]
+        filled = (body
+                  .replace("\x00IMPORTS\x00", _IMPORTS_JOINED[fw])
+                  .replace("\x00SETUP\x00", template["setup"])
+                  .replace("\x00WAIT\x00", template["wait"])
+                  .replace("\x00TEARDOWN\x00", template["teardown"]))
+        head, _, rest = filled.partition(_SKEL_PACKAGE)
+        mid1, _, rest = rest.partition(_SKEL_CLASS)
+        mid2, _, tail = rest.partition(_SKEL_METHOD)
+        skeletons[fw] = (head, mid1, mid2, tail)
+    return skeletons
+
+
+_JAVA_SKELETONS = _build_java_skeletons()
+
+
+class CodeGenerator:
+    """Excel test senaryolarından otomasyon kodu üreten sınıf"""
+    
+    template_dir = "templates"
+    output_dir = "generated_tests"
+
+    # Test dosyası iskeleti: framework'e bağlı parçalar (imports,
+    # setup, teardown, wait) bir kez render edilip sabit parçalara
+    # bölünür; dosya başına yalnız class_name ve test_method eklenir
+    _file_skeletons: Dict[str, tuple] = {}
+    for _fw, _template in _FRAMEWORK_TEMPLATES.items():
+        _rendered = _TEMPLATES["test_file"].render(
+            imports=_IMPORTS_JOINED[_fw],
+            class_name=_SKEL_CLASS,
+            setup=_template["setup"],
+            teardown=_template["teardown"],
+            wait=_template["wait"],
+            test_method=_SKEL_METHOD,
+        )
+        _head, _, _tail = _rendered.partition(_SKEL_METHOD)
+        _file_skeletons[_fw] = (_head.split(_SKEL_CLASS), _tail)
+    del _fw, _template, _rendered, _head, _tail
+
+    def __init__(self):
+        # Framework başına özelleşmiş adım üreticileri (lazy kurulur)
+        self._step_emitters: Dict[str, Any] = {}
+        # Aynı adım dizisine sahip senaryolar için üretilen adım bloğu;
+        # parametrize kopyalarda emitter hiç çalışmaz
+        self._step_lines_cache: Dict[tuple, str] = {}
+
+    def generate_test_project(self, scenarios: List[Dict[str, Any]], project_name: str = "automation_project", project_type: str = "python", framework: str = "selenium", packed: bool = False) -> Dict[str, Any]:
+        """Excel senaryolarından tam otomasyon projesi oluştur
+
+        packed=True ile tüm testler tek bir tests.py dosyasında toplanır;
+        yüzlerce senaryoda dosya başına inode/dizin girdisi maliyeti
+        ortadan kalkar (pytest tek dosyadaki tüm sınıfları toplar).
+        """
+        project_path = os.path.join(self.output_dir, project_name)
+        os.makedirs(project_path, exist_ok=True)
+        
+        # Proje yapısını oluştur; zaman damgası proje başına bir kez
+        # alınır, tüm üretilen dosyalar aynı değeri kullanır
+        project_structure = {
+            "project_path": project_path,
+            "files_created": [],
+            "test_count": len(scenarios),
+            "framework": framework,
+            "project_type": project_type,
+            "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        }
         
-        return content
+        if project_type.lower() == "java":
+            self._create_maven_project(project_path, project_name, project_structure, scenarios)
+        elif project_type.lower() == "nodejs":
+            self._create_nodejs_project(project_path, project_name, project_structure, scenarios)
+        else:
+            self._create_python_project(project_path, project_structure, scenarios, packed=packed)
+
+        return project_structure
     
-    def _create_java_readme_file(self, project_path: str, project_structure: Dict[str, Any]):
-        """Java projesi için README dosyası oluştur"""
-        readme_content = f'''# {project_structure.get("project_name", "TestMate Project")}
+    def _detect_framework(self, scenarios: List[Dict[str, Any]]) -> str:
+        """Test senaryolarından framework türünü tespit et
 
-Bu proje TestMate Studio tarafından otomatik olarak oluşturulmuştur.
+        Tüm listeyi set'e toplamak yerine ilk eşleşen test_type'ta
+        döner; çoğu batch'te ilk senaryo framework'ü belirler.
+        """
+        for scenario in scenarios:
+            test_type = scenario.get('test_type', '').lower()
+            if test_type == 'web':
+                return 'selenium'
+            if test_type == 'mobile':
+                return 'appium'
+            if test_type == 'api':
+                return 'requests'
+        return 'selenium'  # Varsayılan
+    
+    def _create_requirements_file(self, base_path: str, framework: str, pending: List[tuple]):
+        """requirements.txt dosyası oluştur"""
+        data = _REQUIREMENTS_BYTES.get(framework, _REQUIREMENTS_BYTES['selenium'])
+        pending.append((base_path + "requirements.txt", data, 0o644))
 
-## Proje Bilgileri
+    def _create_config_file(self, base_path: str, framework: str, pending: List[tuple]):
+        """Konfigürasyon dosyası oluştur"""
+        pending.append((base_path + "config.py", _config_bytes(framework), 0o644))
+    
+    def _create_setup_script(self, base_path: str, framework: str, pending: List[tuple]):
+        """Otomatik kurulum scripti oluştur"""
+        if os.name == 'nt':  # Windows
+            data = _SETUP_SCRIPT_BYTES["windows"]
+            setup_file = "setup.bat"
+            mode = 0o644
+        else:  # Unix/Linux/Mac
+            data = _SETUP_SCRIPT_BYTES["unix"]
+            setup_file = "setup.sh"
+            mode = 0o755  # Çalıştırılabilir
 
-- **Framework**: {project_structure["framework"]}
-- **Proje Türü**: Java/Maven
-- **Test Sayısı**: {project_structure["test_count"]}
-- **Oluşturulan Dosyalar**: {len(project_structure["files_created"])}
+        pending.append((base_path + setup_file, data, mode))
+        return setup_file
+    
+    def _generate_test_file(self, base_path: str, scenario: Dict[str, Any], framework: str, pending: List[tuple]) -> str:
+        """Tek bir test senaryosu için test dosyası oluştur"""
+        test_id = scenario.get('test_id', 'test')
+        test_name = scenario.get('test_name', 'Test')
+        
+        # Test sınıf adını oluştur
+        class_name = self._generate_class_name(test_name)
+        
+        # Test metodunu oluştur
+        test_method = self._generate_test_method(scenario, framework)
+        
+        # Tam test dosyası içeriğini oluştur
+        test_content = self._generate_test_file_content(class_name, test_method, framework)
+        
+        # Dosyayı kaydet
+        filename = f"test_{test_id.lower()}.py"
+        pending.append((base_path + filename, test_content.encode("utf-8"), 0o644))
+        
+        return filename
+    
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _generate_class_name(test_name: str) -> str:
+        """Test adından sınıf adı oluştur (aynı ad için sonuç cache'li)"""
+        # Özel karakterleri temizle ve camelCase yap
+        if test_name.isascii():
+            clean_name = test_name.translate(_CLASS_NAME_DELETE_TABLE)
+        else:
+            clean_name = _CLASS_NAME_CLEAN_RE.sub('', test_name)
+        words = clean_name.split()
+        class_name = ''.join(word.capitalize() for word in words)
+        return f"Test{class_name}"
+    
+    def _generate_test_method(self, scenario: Dict[str, Any], framework: str) -> str:
+        """Test metodunu oluştur"""
+        # Tekrarlanan sözlük lookuplarını bir kez çözüp locale bağla
+        test_id = scenario.get('test_id', 'test')
+        test_id_lower = test_id.lower()
+        test_description = scenario.get('test_description', 'Test açıklaması')
+
+        # Test adımlarını işle; framework dalları adım başına değil,
+        # emitter kurulurken bir kez çözülür. Senaryo bir kez normalize
+        # IR'a çevrilir: aynı demetler hem memoizasyon anahtarı hem de
+        # emitter girdisidir, adım sözlükleri ikinci kez okunmaz.
+        ir = _parse_steps(scenario.get('steps', []))
+        canon = (framework, ir)
+        steps_code = self._step_lines_cache.get(canon)
+        if steps_code is None:
+            step_lines: List[str] = []
+            emit_step = self._get_step_emitter(framework)
+            for action, locator_type, locator_value, test_data, expected_result in ir:
+                emit_step(action, locator_type, locator_value, test_data,
+                          expected_result, step_lines, "            ")
+            steps_code = "\n".join(step_lines)
+            self._step_lines_cache[canon] = steps_code
+
+        steps_block = f"{steps_code}\n" if steps_code else ""
+        if framework in ('selenium', 'appium'):
+            # test_id üretim anında gömülür; üretilen dosyada düz string kalır
+            screenshot_line = f"            self.driver.save_screenshot('screenshots/error_{test_id}.png')\n"
+        else:
+            screenshot_line = ""
+
+        # Sabit iskelet tek f-string olarak kurulur; satır başına
+        # append/extend yerine bir geçişte tek string üretilir
+        return (
+            f"    def test_{test_id_lower}(self):\n"
+            f'        """{test_description}"""\n'
+            "        try:\n"
+            f"{steps_block}"
+            "            # Test başarılı\n"
+            "            assert True\n"
+            "        except Exception as e:\n"
+            "            # Hata durumunda ekran görüntüsü al\n"
+            f"{screenshot_line}"
+            "            raise e"
+        )
+    
+    def _generate_step_code(self, step: Dict[str, Any], framework: str, out: List[str], indent: str):
+        """Tek bir test adımı için kodu doğrudan out listesine yaz"""
+        (action, locator_type, locator_value, test_data, expected_result), = _parse_steps([step])
+        self._get_step_emitter(framework)(action, locator_type, locator_value,
+                                          test_data, expected_result, out, indent)
+
+    def _get_step_emitter(self, framework: str):
+        """Framework'e özelleşmiş adım üreticisini döndür (cache'li)"""
+        emitter = self._step_emitters.get(framework)
+        if emitter is None:
+            emitter = self._step_emitters[framework] = self._build_step_emitter(framework)
+        return emitter
+
+    def _build_step_emitter(self, framework: str):
+        """Verilen framework için özelleşmiş adım üreticisi kur
+
+        framework'e bağlı tüm kararlar (locator map, bekleme satırı,
+        'aç' aksiyonunun şekli) closure kurulurken bir kez verilir;
+        adım başına yalnızca aksiyon lookup'ı kalır.
+        """
+        locator_map = _FRAMEWORK_LOCATORS.get(framework)
+
+        def element_code(locator_type, locator_value):
+            if locator_map is not None:
+                by_type = locator_map.get(locator_type, locator_map['id'])
+                return f"self.wait.until(EC.element_to_be_clickable(({by_type}, {locator_value!r})))"
+            return f"# Element bulma kodu: {locator_type} = '{locator_value}'"
 
-## Gereksinimler
+        if framework == 'selenium':
+            def open_step(locator_type, locator_value, test_data, out, indent):
+                out.append(f"{indent}self.driver.get({test_data!r})")
+        elif framework == 'appium':
+            def open_step(locator_type, locator_value, test_data, out, indent):
+                out.append(f"{indent}# Uygulama zaten açık")
+        elif framework == 'requests':
+            def open_step(locator_type, locator_value, test_data, out, indent):
+                out.append(f"{indent}response = self.session.get({test_data!r})")
+                out.append(f"{indent}assert response.status_code == 200")
+        else:
+            def open_step(locator_type, locator_value, test_data, out, indent):
+                pass
 
-- Java 11 veya üzeri
-- Maven 3.6 veya üzeri
-- Chrome WebDriver (Selenium için)
-- Appium Server (Mobil testler için)
+        if framework == 'requests':
+            wait_line = "time.sleep(1)"
+        elif framework in ('selenium', 'appium'):
+            wait_line = "time.sleep(2)"
+        else:
+            wait_line = None
 
-## Kurulum
+        def wait_step(locator_type, locator_value, test_data, out, indent):
+            if wait_line is not None:
+                out.append(f"{indent}{wait_line}")
 
-1. Projeyi klonlayın veya indirin
-2. Maven dependencies'leri yükleyin:
-   ```bash
-   mvn clean install
-   ```
+        def click_step(locator_type, locator_value, test_data, out, indent):
+            if locator_value:
+                out.append(f"{indent}element = {element_code(locator_type, locator_value)}")
+                out.append(f"{indent}element.click()")
 
-## Testleri Çalıştırma
+        def type_step(locator_type, locator_value, test_data, out, indent):
+            if locator_value and test_data:
+                out.append(f"{indent}element = {element_code(locator_type, locator_value)}")
+                out.append(f"{indent}element.clear()")
+                out.append(f"{indent}element.send_keys({test_data!r})")
 
-### Tüm Testleri Çalıştırma
-```bash
-mvn test
-```
+        def select_step(locator_type, locator_value, test_data, out, indent):
+            if locator_value and test_data:
+                out.append(f"{indent}element = {element_code(locator_type, locator_value)}")
+                out.append(f"{indent}element.click()")
+                # Dropdown seçimi için ek kod eklenebilir
 
-### TestNG XML ile Çalıştırma
-```bash
-mvn test -DsuiteXmlFile=testng.xml
-```
+        dispatch = {
+            'aç': open_step,
+            'tıkla': click_step,
+            'yaz': type_step,
+            'bekle': wait_step,
+            'seç': select_step,
+        }
 
-### Belirli Test Sınıfını Çalıştırma
-```bash
-mvn test -Dtest=TestClassName
-```
+        def emit(action, locator_type, locator_value, test_data,
+                 expected_result, out, indent):
+            # Alanlar _parse_steps ile önceden normalize edilmiş gelir;
+            # adım başına dict lookup ya da lower() kalmaz
+            handler = dispatch.get(action)
+            if handler is not None:
+                handler(locator_type, locator_value, test_data, out, indent)
 
-## Proje Yapısı
+            # Beklenen sonuç kontrolü
+            if expected_result:
+                out.append(f"{indent}# Beklenen sonuç: {expected_result}")
 
-```
-src/
-├── main/
-│   ├── java/          # Ana Java kaynak kodları
-│   └── resources/     # Kaynak dosyaları
-└── test/
-    ├── java/          # Test Java kaynak kodları
-    └── resources/     # Test kaynak dosyaları
-        └── config.properties  # Test konfigürasyonu
-```
+        return emit
+    
+    def _get_element_code(self, locator_type: str, locator_value: str, framework: str) -> str:
+        """Element bulma kodu oluştur"""
+        locator_map = _FRAMEWORK_LOCATORS.get(framework)
+        if locator_map is not None:
+            by_type = locator_map.get(locator_type, locator_map['id'])
+            return f"self.wait.until(EC.element_to_be_clickable(({by_type}, {locator_value!r})))"
 
-## Konfigürasyon
+        return f"# Element bulma kodu: {locator_type} = '{locator_value}'"
+    
+    def _generate_test_file_content(self, class_name: str, test_method: str, framework: str) -> str:
+        """Tam test dosyası içeriğini oluştur
 
-Test ayarlarını `src/test/resources/config.properties` dosyasından düzenleyebilirsiniz.
+        Framework sabitleri iskelete __init__'te gömüldü; burada sadece
+        iki değişken parça araya eklenir.
+        """
+        chunks, tail = self._file_skeletons[framework]
+        return f"{chunks[0]}{class_name}{chunks[1]}{class_name}{chunks[2]}{test_method}{tail}"
+    
+    def _create_readme_file(self, base_path: str, project_structure: Dict[str, Any], pending: List[tuple]):
+        """README.md dosyası oluştur"""
+        readme_content = _TEMPLATES["readme"].render(
+            framework=project_structure["framework"],
+            test_count=project_structure["test_count"],
+            project_path=project_structure["project_path"],
+            created_at=project_structure["timestamp"],
+        )
+        
+        pending.append((base_path + "README.md", readme_content.encode("utf-8"), 0o644))
+    
+    def _create_test_runner(self, base_path: str, framework: str, pending: List[tuple]) -> str:
+        """Test runner script'i oluştur"""
+        # Çalıştırılabilir (0o755); içerik framework başına bir kez
+        # render+encode edilir
+        pending.append((base_path + "run_tests.py", _runner_bytes(framework), 0o755))
+        
+        return "run_tests.py"
 
-## Raporlar
+    def _create_maven_project(self, project_path: str, project_name: str, project_structure: Dict[str, Any], scenarios: List[Dict[str, Any]]):
+        """Maven projesi oluştur"""
+        # Maven dizin yapısını oluştur
+        src_main_java = os.path.join(project_path, "src", "main", "java")
+        src_test_java = os.path.join(project_path, "src", "test", "java")
+        src_main_resources = os.path.join(project_path, "src", "main", "resources")
+        src_test_resources = os.path.join(project_path, "src", "test", "resources")
 
-Test raporları `target/reports` klasöründe oluşturulur.
+        package_name = f"com.testmate.{project_name.lower().replace('-', '').replace('_', '')}"
+        test_package_path = os.path.join(src_test_java, *package_name.split('.'))
 
-## Destek
+        # Yalnızca en derin yapraklar oluşturulur, derinden sığa doğru:
+        # ilk makedirs tüm ortak ataları yaratır, sonrakiler ilk var olan
+        # bileşende erken çıkar — path bileşeni başına stat yarıya iner
+        for leaf in (test_package_path, src_main_java, src_main_resources, src_test_resources):
+            os.makedirs(leaf, exist_ok=True)
 
-TestMate Studio ile oluşturulan bu proje için destek almak için:
-- Dokümantasyonu inceleyin
-- TestMate Studio'yu kullanın
-- Gerekirse ek test senaryoları ekleyin
+        # pom.xml oluştur
+        self._create_pom_xml(project_path, project_name, project_structure["framework"])
+        project_structure["files_created"].append("pom.xml")
 
----
-*TestMate Studio tarafından oluşturuldu - {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}*
-'''
+        # Test dosyalarını oluştur; paket dizini bir kez ayırıcıyla
+        # bitirilir, senaryo başına os.path.join çağrısı kalmaz.
+        # Framework çözümü, iskelet ve göreli yol öneki de senaryolar
+        # boyunca sabittir — döngü öncesi bir kez hesaplanır
+        test_package_dir = test_package_path + os.sep
+        java_framework = self._get_java_framework(project_structure["framework"])
+        skeleton = _JAVA_SKELETONS.get(java_framework, _JAVA_SKELETONS["selenium-java"])
+        rel_prefix = f"src/test/java/{package_name.replace('.', '/')}/"
+
+        # Senaryolar birbirinden bağımsız ve her biri kendi dosyasını
+        # yazar; render + write thread havuzunda paralel koşar, map
+        # sırayı koruduğu için files_created sıralaması değişmez
+        def render_scenario(scenario: Dict[str, Any]) -> str:
+            return self._generate_java_test_file(test_package_dir, scenario, java_framework, package_name, skeleton, rel_prefix)
+
+        if len(scenarios) <= 1:
+            for scenario in scenarios:
+                project_structure["files_created"].append(render_scenario(scenario))
+        else:
+            with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as executor:
+                project_structure["files_created"].extend(executor.map(render_scenario, scenarios))
+        
+        # TestNG XML oluştur
+        self._create_testng_xml(project_path, package_name)
+        project_structure["files_created"].append("testng.xml")
+        
+        # README dosyası oluştur
+        self._create_java_readme_file(project_path, project_structure)
+        project_structure["files_created"].append("README.md")
+        
+        # Config dosyası oluştur
+        self._create_java_config_file(src_test_resources, project_structure["framework"])
+        project_structure["files_created"].append("src/test/resources/config.properties")
+    
+    def _create_pom_xml(self, project_path: str, project_name: str, framework: str):
+        """Maven pom.xml dosyası oluştur
+
+        Framework'e özgü bağımlılık blokları şablondaki {% if %} dallarıyla
+        seçilir; eski string birleştirme her += adımında tüm biriken
+        içeriği kopyalıyordu, render tek geçişte üretir.
+        """
+        pom_content = _TEMPLATES["pom"].render(
+            artifact_id=project_name.lower().replace(' ', '-'),
+            project_name=project_name,
+            framework=framework,
+        )
+        self._write_text(os.path.join(project_path, "pom.xml"), pom_content)
+
+    def _create_testng_xml(self, project_path: str, package_name: str):
+        """TestNG XML dosyası oluştur"""
+        testng_content = _TEMPLATES["testng"].render(package_name=package_name)
+        self._write_text(os.path.join(project_path, "testng.xml"), testng_content)
 
-        with open(os.path.join(project_path, "README.md"), "w", encoding="utf-8") as f:
-            f.write(readme_content)
+    def _create_java_config_file(self, resources_path: str, framework: str):
+        """Java konfigürasyon dosyası oluştur"""
+        config_content = _TEMPLATES["java_config"].render(framework=framework)
+        self._write_text(os.path.join(resources_path, "config.properties"), config_content)
+    
+    def _generate_java_test_file(self, test_package_dir: str, scenario: Dict[str, Any], java_framework: str, package_name: str, skeleton: tuple, rel_prefix: str) -> str:
+        """Java test dosyası oluştur
+
+        Framework çözümü, iskelet ve göreli yol öneki çağıran tarafta
+        bir kez hesaplanıp geçirilir; senaryo başına yalnız sınıf adı
+        ve metod gövdesi üretilir.
+        """
+        test_name = scenario.get('test_name', 'TestScenario')
+        class_name = self._generate_java_class_name(test_name)
+
+        # Test metodunu oluştur
+        test_method = self._generate_java_test_method(scenario, java_framework)
+
+        # Test dosyası içeriğini oluştur
+        head, mid1, mid2, tail = skeleton
+        test_content = f"{head}{package_name}{mid1}{class_name}{mid2}{test_method}{tail}"
+
+        # Dosyayı kaydet
+        self._write_text(f"{test_package_dir}{class_name}.java", test_content)
+
+        return f"{rel_prefix}{class_name}.java"
+    
+    @staticmethod
+    def _get_java_framework(framework: str) -> str:
+        """Framework'ü Java karşılığına çevir"""
+        return _JAVA_FRAMEWORK_MAP.get(framework, "selenium-java")
+
+    @staticmethod
+    @lru_cache(maxsize=512)
+    def _generate_java_class_name(test_name: str) -> str:
+        """Java sınıf adı oluştur (aynı ad için sonuç cache'li)"""
+        # Test adından geçerli Java sınıf adı oluştur
+        class_name = _JAVA_CLASS_NAME_CLEAN_RE.sub('', test_name)
+        if not class_name[0].isalpha():
+            class_name = "Test" + class_name
+        return class_name + "Test"
+    
+    def _generate_java_test_method(self, scenario: Dict[str, Any], framework: str) -> str:
+        """Java test metodu oluştur
+
+        Sabit baş/son bloklar ve adım parçaları çok satırlı şablonlardan
+        gelir; satır başına liste büyütme yerine hazır bloklar join'lenir.
+        """
+        head = _JAVA_METHOD_HEADS.get(framework)
+        if head is None:
+            return ""
+
+        chunks = [head]
+        for step in scenario.get('steps', []):
+            step_code = self._generate_java_step_code(step, framework)
+            if step_code:
+                chunks.append(step_code)
+        chunks.append(_JAVA_METHOD_TAIL)
+        return "\n".join(chunks)
+
+    def _generate_java_step_code(self, step: Dict[str, Any], framework: str) -> str:
+        """Java adım kodunu tek çok satırlı blok olarak üret"""
+        action = step.get('action', '').lower()
+        if framework == "rest-assured":
+            kind = _java_api_action_kind(action)
+        else:
+            kind = _java_ui_action_kind(action)
+
+        template = _JAVA_STEP_TEMPLATES.get((framework, kind))
+        if template is None:
+            return ""
 
-    def _create_python_project(self, project_path: str, project_structure: Dict[str, Any], scenarios: List[Dict[str, Any]]):
+        element = step.get('element', '')
+        return template.format(
+            element=element,
+            value=step.get('value', ''),
+            var=element.lower().replace(' ', '_'),
+        )
+
+    def _create_java_readme_file(self, project_path: str, project_structure: Dict[str, Any]):
+        """Java projesi için README dosyası oluştur"""
+        readme_content = _TEMPLATES["java_readme"].render(
+            project_name=project_structure.get("project_name", "TestMate Project"),
+            framework=project_structure["framework"],
+            test_count=project_structure["test_count"],
+            files_created=len(project_structure["files_created"]),
+            created_at=project_structure["timestamp"],
+        )
+        self._write_text(os.path.join(project_path, "README.md"), readme_content)
+
+    def _create_python_project(self, project_path: str, project_structure: Dict[str, Any], scenarios: List[Dict[str, Any]], packed: bool = False):
         """Python projesi oluştur"""
+        # Dosyalar önce bellekte (path, bytes, mode) olarak toplanır,
+        # en sonda tek seferde diske yazılır. Kök yol bir kez ayırıcıyla
+        # bitirilir; dosya başına os.path.join çağrısına gerek kalmaz.
+        pending: List[tuple] = []
+        base_path = os.fspath(project_path) + os.sep
+
         # requirements.txt oluştur
-        self._create_requirements_file(project_path, project_structure["framework"])
+        self._create_requirements_file(base_path, project_structure["framework"], pending)
         project_structure["files_created"].append("requirements.txt")
         
         # Setup script oluştur
-        setup_file = self._create_setup_script(project_path, project_structure["framework"])
+        setup_file = self._create_setup_script(base_path, project_structure["framework"], pending)
         project_structure["files_created"].append(setup_file)
         
         # config dosyası oluştur
-        self._create_config_file(project_path, project_structure["framework"])
+        self._create_config_file(base_path, project_structure["framework"], pending)
         project_structure["files_created"].append("config.py")
         
-        # Test dosyalarını oluştur
-        for scenario in scenarios:
-            test_file = self._generate_test_file(project_path, scenario, project_structure["framework"])
-            project_structure["files_created"].append(test_file)
+        framework = project_structure["framework"]
+
+        if packed:
+            # Tüm testler tek dosyada: import bloğu bir kez, ardından
+            # her senaryonun sınıfı; dizin girdisi/inode maliyeti 1'e iner
+            sections = []
+            for scenario in scenarios:
+                class_name = self._generate_class_name(scenario.get('test_name', 'Test'))
+                test_method = self._generate_test_method(scenario, framework)
+                content = self._generate_test_file_content(class_name, test_method, framework)
+                if sections:
+                    # Sonraki bölümlerde import'ları atla, sınıftan başla
+                    content = content[content.index("class "):]
+                sections.append(content)
+            pending.append((base_path + "tests.py", "\n\n".join(sections).encode("utf-8"), 0o644))
+            project_structure["files_created"].append("tests.py")
+        else:
+            # Test dosyalarını oluştur: senaryolar birbirinden bağımsız,
+            # render'lar thread havuzunda paralel koşar (derlenmiş Jinja
+            # şablonları thread-safe); her task kendi lokal listesine yazar
+            def render_scenario(scenario: Dict[str, Any]):
+                local: List[tuple] = []
+                filename = self._generate_test_file(base_path, scenario, framework, local)
+                return filename, local
+
+            with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as executor:
+                for future in [executor.submit(render_scenario, s) for s in scenarios]:
+                    test_file, rendered = future.result()
+                    pending.extend(rendered)
+                    project_structure["files_created"].append(test_file)
         
         # README dosyası oluştur
-        self._create_readme_file(project_path, project_structure)
+        self._create_readme_file(base_path, project_structure, pending)
         project_structure["files_created"].append("README.md")
         
         # Test runner oluştur
-        runner_file = self._create_test_runner(project_path, project_structure["framework"])
-        project_structure["files_created"].append(runner_file) 
\ No newline at end of file
+        runner_file = self._create_test_runner(base_path, project_structure["framework"], pending)
+        project_structure["files_created"].append(runner_file)
+        
+        # Biriken dosyaları tek geçişte diske yaz
+        self._flush_files(pending)
+
+    def _write_text(self, path: str, content: str, mode: int = 0o644):
+        """UTF-8 metni tek open/write/close ile diske yaz
+
+        Text-mode open'ın TextIOWrapper + BufferedWriter katmanlarını
+        atlar; çalıştırılabilir dosyalarda mode ile ayrı chmod çağrısı
+        da kaynaşır.
+        """
+        data = content.encode("utf-8")
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, mode)
+        try:
+            os.write(fd, data)
+            if os.name != 'nt':
+                # Windows'ta fchmod yok ve exec biti anlamsız; mevcut
+                # dosyalarda mode'u yalnız POSIX'te tazele
+                os.fchmod(fd, mode)
+        finally:
+            os.close(fd)
+
+    def _flush_files(self, files: List[tuple]):
+        """Biriktirilen (path, bytes, mode) üçlülerini diske yaz
+
+        Dosya başına open/write/close yerine os seviyesinde tek açma +
+        tek yazma; yüzlerce senaryoda syscall sayısını ciddi azaltır.
+        Yazım sırası path'e göre sıralanır: aynı dizine ardışık ve
+        sıralı girişler dizin-entry cache'ini sıcak tutar. Büyük
+        projelerde yazımlar thread havuzuna dağıtılır; open/write
+        GIL'i bıraktığından özellikle ağ dosya sistemlerinde gecikme
+        üst üste binmek yerine paralel ödenir.
+        """
+        ordered = sorted(files, key=lambda f: f[0])
+        if len(ordered) <= 8:
+            for filepath, data, mode in ordered:
+                self._write_one(filepath, data, mode)
+            return
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            for future in [executor.submit(self._write_one, *f) for f in ordered]:
+                future.result()
+
+    @staticmethod
+    def _write_one(filepath: str, data: bytes, mode: int):
+        fd = os.open(filepath, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, mode)
+        try:
+            os.write(fd, data)
+        finally:
+            os.close(fd) 
\ No newline at end of file
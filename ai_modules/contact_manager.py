@@ -4,34 +4,160 @@ TestMate Studio - İletişim Formu Yöneticisi
 
 import json
 import os
+from collections import Counter
 from datetime import datetime
 from typing import Dict, Any, List
 
+try:
+    # C seviyesinde parse/serialize: stdlib json'a göre 3-10x hızlı
+    import orjson
+except ImportError:
+    orjson = None
+
 class ContactManager:
+    # Bu kadar append'ten sonra log snapshot'a sıkıştırılır
+    _COMPACT_EVERY = 100
+
     def __init__(self):
         self.contacts_file = "data/contact_requests.json"
+        self.log_file = "data/contact_requests.ndjson"
+        # mtime tabanlı önbellek: dosya değişmediyse yeniden parse edilmez
+        self._mtime_ns = -1
         self._ensure_data_directory()
+        # Sıcak yol: her mutasyonda tüm listeyi yeniden yazmak yerine
+        # NDJSON log'a tek satır append edilir. Log, yükleme sırasında
+        # gerekirse sıkıştırılabilsin diye _load_contacts'tan önce açılır
+        self._log = open(self.log_file, 'ab', buffering=1 << 15)
+        self._log_writes = 0
         self._load_contacts()
-    
+
     def _ensure_data_directory(self):
         """Data dizinini oluştur"""
         os.makedirs("data", exist_ok=True)
-    
+
     def _load_contacts(self):
-        """Mevcut iletişim taleplerini yükle"""
-        if os.path.exists(self.contacts_file):
+        """Mevcut iletişim taleplerini yükle
+
+        Her çağrıda dosyayı baştan parse etmek yerine st_mtime_ns
+        karşılaştırılır; değişmemişse bellekteki kopya geçerlidir.
+        """
+        try:
+            st = os.stat(self.contacts_file)
+        except OSError:
+            self.contacts = {"requests": []}
+            self._mtime_ns = -1
+            replayed = self._replay_log()
+            self._rebuild_stats()
+            if replayed >= self._COMPACT_EVERY:
+                self._compact()
+            return
+        if st.st_mtime_ns == self._mtime_ns:
+            return
+        try:
+            with open(self.contacts_file, 'rb') as f:
+                raw = f.read()
+            self.contacts = orjson.loads(raw) if orjson is not None else json.loads(raw)
+            self._mtime_ns = st.st_mtime_ns
+        except:
+            self.contacts = {"requests": []}
+            self._mtime_ns = -1
+        replayed = self._replay_log()
+        self._rebuild_stats()
+        # Tetikleyici kalıcı duruma bağlı: her istekte taze instance
+        # kuran kullanımda bellekteki sayaç hiç dolmaz, log sınırsız
+        # büyürdü — kuyruk eşiği aşmışsa yükleme sırasında sıkıştır
+        if replayed >= self._COMPACT_EVERY:
+            self._compact()
+
+    def _replay_log(self) -> int:
+        """Snapshot'tan sonra NDJSON kuyruğunu uygula
+
+        Log'daki her satır bir kaydın tam halidir; id üzerinden upsert
+        yapmak tekrar oynatmayı idempotent kılar. Oynatılan satır
+        sayısını döndürür; çağıran buna göre sıkıştırmaya karar verir.
+        """
+        try:
+            with open(self.log_file, 'rb') as f:
+                lines = f.read().splitlines()
+        except OSError:
+            return 0
+        if not lines:
+            return 0
+        requests = self.contacts.setdefault("requests", [])
+        index = {r.get("id"): r for r in requests}
+        replayed = 0
+        for line in lines:
+            if not line:
+                continue
             try:
-                with open(self.contacts_file, 'r', encoding='utf-8') as f:
-                    self.contacts = json.load(f)
+                record = orjson.loads(line) if orjson is not None else json.loads(line)
             except:
-                self.contacts = {"requests": []}
-        else:
-            self.contacts = {"requests": []}
-    
+                continue  # yarım kalmış son satır
+            replayed += 1
+            existing = index.get(record.get("id"))
+            if existing is not None:
+                existing.clear()
+                existing.update(record)
+            else:
+                requests.append(record)
+                index[record.get("id")] = record
+        return replayed
+
+    def _rebuild_stats(self):
+        """Sayaçları diskteki listeden bir kez kur
+
+        get_statistics her çağrıda tüm listeyi taramak yerine bu
+        sayaçları okur; mutasyonlar sayaçları artımlı günceller.
+        """
+        requests = self.contacts.get("requests", [])
+        self._total = len(requests)
+        self._new = sum(1 for r in requests if r.get("status") == "new")
+        self._processed = sum(1 for r in requests if r.get("processed") == True)
+        self._plan_counts = Counter(r.get("plan_name", "Bilinmeyen") for r in requests)
+        # ID -> kayıt indeksi: lineer arama yerine O(1) erişim
+        self._by_id = {r.get("id"): r for r in requests}
+
     def _save_contacts(self):
-        """İletişim taleplerini kaydet"""
-        with open(self.contacts_file, 'w', encoding='utf-8') as f:
-            json.dump(self.contacts, f, ensure_ascii=False, indent=2)
+        """İletişim taleplerini kaydet
+
+        json.dump dosya tutacağına token token yazar (girintili modda
+        kayıt başına onlarca küçük write); önce tek buffer'a serialize
+        edilip diske tek write ile inilir.
+        """
+        if orjson is not None:
+            payload = orjson.dumps(self.contacts, option=orjson.OPT_INDENT_2)
+        else:
+            payload = json.dumps(self.contacts, ensure_ascii=False, indent=2).encode('utf-8')
+        with open(self.contacts_file, 'wb') as f:
+            f.write(payload)
+        # Kendi yazdığımız içerik için mtime'ı tazele; bir sonraki
+        # _load_contacts diskten okumadan bellekteki kopyayı kullanır
+        try:
+            self._mtime_ns = os.stat(self.contacts_file).st_mtime_ns
+        except OSError:
+            self._mtime_ns = -1
+
+    def _append_log(self, record: Dict[str, Any]):
+        """Mutasyonu log'a tek satır olarak ekle
+
+        Yazma maliyeti kayıt sayısından bağımsız O(1); her
+        _COMPACT_EVERY append'te log snapshot'a sıkıştırılır.
+        """
+        if orjson is not None:
+            line = orjson.dumps(record)
+        else:
+            line = json.dumps(record, ensure_ascii=False).encode('utf-8')
+        self._log.write(line + b'\n')
+        self._log.flush()
+        self._log_writes += 1
+        if self._log_writes >= self._COMPACT_EVERY:
+            self._compact()
+
+    def _compact(self):
+        """Log'u JSON snapshot'a sıkıştır ve sıfırla"""
+        self._save_contacts()
+        self._log.truncate(0)
+        self._log_writes = 0
     
     def submit_plan_request(self, request_data: Dict[str, Any]) -> Dict[str, Any]:
         """Plan talebi kaydet"""
@@ -58,7 +184,11 @@ class ContactManager:
             
             # Talebi kaydet
             self.contacts["requests"].append(contact_request)
-            self._save_contacts()
+            self._by_id[contact_request["id"]] = contact_request
+            self._total += 1
+            self._new += 1
+            self._plan_counts[contact_request["plan_name"]] += 1
+            self._append_log(contact_request)
             
             return {
                 "success": True,
@@ -76,41 +206,37 @@ class ContactManager:
     
     def get_request_by_id(self, request_id: int) -> Dict[str, Any]:
         """ID'ye göre talep getir"""
-        for request in self.contacts.get("requests", []):
-            if request.get("id") == request_id:
-                return request
-        return None
-    
+        return self._by_id.get(request_id)
+
     def update_request_status(self, request_id: int, status: str, processed: bool = True) -> bool:
         """Talep durumunu güncelle"""
-        for request in self.contacts.get("requests", []):
-            if request.get("id") == request_id:
-                request["status"] = status
-                request["processed"] = processed
-                request["processed_date"] = datetime.now().isoformat()
-                self._save_contacts()
-                return True
-        return False
+        request = self._by_id.get(request_id)
+        if request is None:
+            return False
+        # Geçişe göre sayaçları artımlı güncelle
+        if request.get("status") == "new" and status != "new":
+            self._new -= 1
+        elif request.get("status") != "new" and status == "new":
+            self._new += 1
+        if not request.get("processed") and processed:
+            self._processed += 1
+        elif request.get("processed") and not processed:
+            self._processed -= 1
+        request["status"] = status
+        request["processed"] = processed
+        request["processed_date"] = datetime.now().isoformat()
+        self._append_log(request)
+        return True
     
     def get_statistics(self) -> Dict[str, Any]:
-        """İstatistikleri getir"""
-        requests = self.contacts.get("requests", [])
-        
-        total_requests = len(requests)
-        new_requests = len([r for r in requests if r.get("status") == "new"])
-        processed_requests = len([r for r in requests if r.get("processed") == True])
-        
-        # Plan bazında istatistikler
-        plan_stats = {}
-        for request in requests:
-            plan = request.get("plan_name", "Bilinmeyen")
-            if plan not in plan_stats:
-                plan_stats[plan] = 0
-            plan_stats[plan] += 1
-        
+        """İstatistikleri getir
+
+        Sayaçlar mutasyonlarda güncel tutulduğundan burada liste
+        taraması yok: O(1).
+        """
         return {
-            "total_requests": total_requests,
-            "new_requests": new_requests,
-            "processed_requests": processed_requests,
-            "plan_statistics": plan_stats
-        } 
\ No newline at end of file
+            "total_requests": self._total,
+            "new_requests": self._new,
+            "processed_requests": self._processed,
+            "plan_statistics": dict(self._plan_counts)
+        }
\ No newline at end of file